@@ -9,10 +9,12 @@ Endpoints are registered based on the resources enabled in the config.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
+from homeassistant.components.http import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 
 from .const import (
     CONF_AUTOMATIONS_CREATE,
@@ -54,6 +56,11 @@ from .const import (
     CONF_SCRIPTS_READ,
     CONF_SCRIPTS_UPDATE,
     DATA_DASHBOARDS_COLLECTION,
+    DATA_DASHBOARDS_COLLECTION_LOADED,
+    DATA_DASHBOARDS_CONFIG_CACHE,
+    DATA_DASHBOARDS_INFO_CACHE,
+    DATA_DASHBOARDS_URL_INDEX,
+    DATA_PERMISSION_CACHE,
     DEFAULT_OPTIONS,
     DOMAIN,
     RESOURCE_AREAS,
@@ -78,6 +85,7 @@ from .views import (
     AutomationTriggerView,
     CategoryDetailView,
     CategoryScopeListView,
+    DashboardBatchView,
     DashboardConfigView,
     DashboardDetailView,
     DashboardListView,
@@ -110,6 +118,7 @@ from .views import (
     ServiceDetailView,
     ServiceListView,
 )
+from .views.dashboards import invalidate_dashboard_list
 from .mcp_http import MCPOAuthMetadataView, MCPStreamableView
 
 _LOGGER = logging.getLogger(__name__)
@@ -118,6 +127,140 @@ _LOGGER = logging.getLogger(__name__)
 _REGISTERED_VIEWS: set[str] = set()
 
 
+@dataclass(frozen=True)
+class _ViewGroup:
+    """HTTP views that are registered together for one resource."""
+
+    # The group is registered once any of these options is enabled
+    options: tuple[str, ...]
+    views: tuple[type[HomeAssistantView], ...]
+    # Where the endpoints live, for the registration log message
+    endpoints: str
+    # Whether the view constructors take the hass instance
+    pass_hass: bool = False
+
+
+# Resource -> views, in registration order. The MCP server views need extra
+# setup and are registered separately in _register_views.
+_VIEW_GROUPS: dict[str, _ViewGroup] = {
+    RESOURCE_DASHBOARDS: _ViewGroup(
+        (
+            CONF_DASHBOARDS_READ,
+            CONF_DASHBOARDS_CREATE,
+            CONF_DASHBOARDS_UPDATE,
+            CONF_DASHBOARDS_DELETE,
+        ),
+        (
+            DashboardListView,
+            DashboardBatchView,
+            DashboardDetailView,
+            DashboardConfigView,
+            ResourceListView,
+        ),
+        "dashboard API endpoints at /api/config_mcp/dashboards and /api/config_mcp/resources",
+        pass_hass=True,
+    ),
+    RESOURCE_ENTITIES: _ViewGroup(
+        (CONF_DISCOVERY_ENTITIES,),
+        (
+            EntityListView,
+            EntityDetailView,
+            DomainListView,
+            DomainEntitiesView,
+            EntityUsageView,
+        ),
+        "entity discovery API endpoints at /api/config_mcp/entities",
+    ),
+    RESOURCE_DEVICES: _ViewGroup(
+        (CONF_DISCOVERY_DEVICES,),
+        (DeviceListView, DeviceDetailView),
+        "device discovery API endpoints at /api/config_mcp/devices",
+    ),
+    RESOURCE_AREAS: _ViewGroup(
+        (CONF_DISCOVERY_AREAS,),
+        (AreaListView, AreaDetailView, FloorListView, FloorDetailView),
+        "area/floor discovery API endpoints at /api/config_mcp/areas and /api/config_mcp/floors",
+    ),
+    RESOURCE_INTEGRATIONS: _ViewGroup(
+        (CONF_DISCOVERY_INTEGRATIONS,),
+        (IntegrationListView, IntegrationDetailView),
+        "integration discovery API endpoints at /api/config_mcp/integrations",
+    ),
+    RESOURCE_SERVICES: _ViewGroup(
+        (CONF_DISCOVERY_SERVICES,),
+        (ServiceListView, DomainServiceListView, ServiceDetailView),
+        "service discovery API endpoints at /api/config_mcp/services",
+    ),
+    RESOURCE_AUTOMATIONS: _ViewGroup(
+        (
+            CONF_AUTOMATIONS_READ,
+            CONF_AUTOMATIONS_CREATE,
+            CONF_AUTOMATIONS_UPDATE,
+            CONF_AUTOMATIONS_DELETE,
+        ),
+        (AutomationListView, AutomationDetailView, AutomationTriggerView),
+        "automation API endpoints at /api/config_mcp/automations",
+    ),
+    RESOURCE_SCRIPTS: _ViewGroup(
+        (
+            CONF_SCRIPTS_READ,
+            CONF_SCRIPTS_CREATE,
+            CONF_SCRIPTS_UPDATE,
+            CONF_SCRIPTS_DELETE,
+        ),
+        (ScriptListView, ScriptDetailView, ScriptRunView, ScriptStopView),
+        "script API endpoints at /api/config_mcp/scripts",
+    ),
+    RESOURCE_SCENES: _ViewGroup(
+        (
+            CONF_SCENES_READ,
+            CONF_SCENES_CREATE,
+            CONF_SCENES_UPDATE,
+            CONF_SCENES_DELETE,
+        ),
+        (SceneListView, SceneDetailView, SceneActivateView),
+        "scene API endpoints at /api/config_mcp/scenes",
+    ),
+    RESOURCE_LOGS: _ViewGroup(
+        (CONF_LOGS_READ,),
+        (LogListView, LogErrorsView),
+        "log API endpoints at /api/config_mcp/logs",
+    ),
+    RESOURCE_CATEGORIES: _ViewGroup(
+        (
+            CONF_CATEGORIES_READ,
+            CONF_CATEGORIES_CREATE,
+            CONF_CATEGORIES_UPDATE,
+            CONF_CATEGORIES_DELETE,
+        ),
+        (CategoryScopeListView, CategoryDetailView),
+        "category API endpoints at /api/config_mcp/categories",
+        pass_hass=True,
+    ),
+    RESOURCE_LABELS: _ViewGroup(
+        (
+            CONF_LABELS_READ,
+            CONF_LABELS_CREATE,
+            CONF_LABELS_UPDATE,
+            CONF_LABELS_DELETE,
+        ),
+        (LabelListView, LabelDetailView),
+        "label API endpoints at /api/config_mcp/labels",
+        pass_hass=True,
+    ),
+    RESOURCE_HELPERS: _ViewGroup(
+        (
+            CONF_HELPERS_READ,
+            CONF_HELPERS_CREATE,
+            CONF_HELPERS_UPDATE,
+            CONF_HELPERS_DELETE,
+        ),
+        (HelperListView, HelperDetailView),
+        "helper API endpoints at /api/config_mcp/helpers",
+    ),
+}
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old config entry to new version.
 
@@ -208,6 +351,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Configuration MCP Server from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = entry.data
+    hass.data.pop(DATA_PERMISSION_CACHE, None)
 
     # Get options (with migration support)
     options = _get_options(entry)
@@ -222,7 +366,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         options.get(CONF_DASHBOARDS_DELETE)
     )
     if dashboards_enabled:
-        await _setup_dashboards_collection(hass)
+        await _setup_dashboards_collection(hass, entry)
 
     # Pre-register MCP tools in executor to avoid blocking event loop
     # This must happen before _register_views so tools are ready when MCP server starts
@@ -240,10 +384,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def _setup_dashboards_collection(hass: HomeAssistant) -> None:
+@callback
+def _clear_dashboard_caches(hass: HomeAssistant) -> None:
+    """Drop cached dashboard data.
+
+    The views outlive the entry, but the lovelace listeners that keep these
+    caches fresh do not, so the caches must go with them.
+    """
+    for key in (
+        DATA_DASHBOARDS_CONFIG_CACHE,
+        DATA_DASHBOARDS_INFO_CACHE,
+        DATA_DASHBOARDS_URL_INDEX,
+    ):
+        hass.data.pop(key, None)
+    invalidate_dashboard_list(hass)
+
+
+async def _setup_dashboards_collection(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> None:
     """Set up the dashboards collection for CRUD operations."""
+    # Anything cached while no listeners were attached may be stale
+    _clear_dashboard_caches(hass)
+
     # Import here to avoid circular imports and ensure lovelace is loaded
     try:
+        from homeassistant.components.frontend import EVENT_PANELS_UPDATED
+        from homeassistant.components.lovelace.const import EVENT_LOVELACE_UPDATED
         from homeassistant.components.lovelace.dashboard import DashboardsCollection
     except ImportError:
         _LOGGER.error("Could not import DashboardsCollection from lovelace")
@@ -253,13 +420,46 @@ async def _setup_dashboards_collection(hass: HomeAssistant) -> None:
     collection = DashboardsCollection(hass)
     await collection.async_load()
     hass.data[DATA_DASHBOARDS_COLLECTION] = collection
+    hass.data[DATA_DASHBOARDS_COLLECTION_LOADED] = True
     _LOGGER.debug("DashboardsCollection initialized with %d items", len(collection.data))
 
+    @callback
+    def _async_panels_updated(event: Event) -> None:
+        """Mark dashboard data stale when dashboards change elsewhere.
+
+        Lovelace re-registers its panels whenever a storage dashboard is
+        created, updated or deleted, so this catches edits from the HA UI.
+        """
+        hass.data.pop(DATA_DASHBOARDS_COLLECTION_LOADED, None)
+        hass.data.pop(DATA_DASHBOARDS_INFO_CACHE, None)
+        invalidate_dashboard_list(hass)
+
+    @callback
+    def _async_lovelace_updated(event: Event) -> None:
+        """Drop cached data of a dashboard whose config was saved or deleted."""
+        url_path = event.data.get("url_path")
+        for key in (DATA_DASHBOARDS_CONFIG_CACHE, DATA_DASHBOARDS_INFO_CACHE):
+            if (cache := hass.data.get(key)) is not None:
+                cache.pop(url_path, None)
+        # The listed mode flips between auto-gen and storage on first save/delete
+        invalidate_dashboard_list(hass)
+
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_PANELS_UPDATED, _async_panels_updated)
+    )
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_LOVELACE_UPDATED, _async_lovelace_updated)
+    )
+    # Encoded configs are only cached while the listener above can evict them
+    hass.data[DATA_DASHBOARDS_CONFIG_CACHE] = {}
+
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
         del hass.data[DOMAIN][entry.entry_id]
+    hass.data.pop(DATA_PERMISSION_CACHE, None)
+    _clear_dashboard_caches(hass)
 
     # Note: HTTP views cannot be unregistered in HA, they persist until restart
     _LOGGER.info(
@@ -271,6 +471,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
+    # Drop memoized permission checks so the new options take effect
+    hass.data.pop(DATA_PERMISSION_CACHE, None)
+
     options = _get_options(entry)
     _LOGGER.info("Configuration MCP Server options updated: %s", options)
 
@@ -290,64 +493,16 @@ def _register_views(hass: HomeAssistant, options: dict[str, Any]) -> None:
         hass: Home Assistant instance
         options: Configuration options dict
     """
-    global _REGISTERED_VIEWS
-
-    # Dashboard views (if any dashboard permission is enabled)
-    dashboards_enabled = (
-        options.get(CONF_DASHBOARDS_READ) or
-        options.get(CONF_DASHBOARDS_CREATE) or
-        options.get(CONF_DASHBOARDS_UPDATE) or
-        options.get(CONF_DASHBOARDS_DELETE)
-    )
-    if dashboards_enabled and RESOURCE_DASHBOARDS not in _REGISTERED_VIEWS:
-        hass.http.register_view(DashboardListView())
-        hass.http.register_view(DashboardDetailView())
-        hass.http.register_view(DashboardConfigView())
-        hass.http.register_view(ResourceListView())
-        _REGISTERED_VIEWS.add(RESOURCE_DASHBOARDS)
-        _LOGGER.info("Registered dashboard API endpoints at /api/config_mcp/dashboards")
-        _LOGGER.info("Registered resources API endpoint at /api/config_mcp/resources")
-
-    # Entity discovery views
-    if options.get(CONF_DISCOVERY_ENTITIES) and RESOURCE_ENTITIES not in _REGISTERED_VIEWS:
-        hass.http.register_view(EntityListView())
-        hass.http.register_view(EntityDetailView())
-        hass.http.register_view(DomainListView())
-        hass.http.register_view(DomainEntitiesView())
-        hass.http.register_view(EntityUsageView())
-        _REGISTERED_VIEWS.add(RESOURCE_ENTITIES)
-        _LOGGER.info("Registered entity discovery API endpoints at /api/config_mcp/entities")
-
-    # Device discovery views
-    if options.get(CONF_DISCOVERY_DEVICES) and RESOURCE_DEVICES not in _REGISTERED_VIEWS:
-        hass.http.register_view(DeviceListView())
-        hass.http.register_view(DeviceDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_DEVICES)
-        _LOGGER.info("Registered device discovery API endpoints at /api/config_mcp/devices")
-
-    # Area/Floor discovery views
-    if options.get(CONF_DISCOVERY_AREAS) and RESOURCE_AREAS not in _REGISTERED_VIEWS:
-        hass.http.register_view(AreaListView())
-        hass.http.register_view(AreaDetailView())
-        hass.http.register_view(FloorListView())
-        hass.http.register_view(FloorDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_AREAS)
-        _LOGGER.info("Registered area/floor discovery API endpoints at /api/config_mcp/areas and /api/config_mcp/floors")
-
-    # Integration discovery views
-    if options.get(CONF_DISCOVERY_INTEGRATIONS) and RESOURCE_INTEGRATIONS not in _REGISTERED_VIEWS:
-        hass.http.register_view(IntegrationListView())
-        hass.http.register_view(IntegrationDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_INTEGRATIONS)
-        _LOGGER.info("Registered integration discovery API endpoints at /api/config_mcp/integrations")
-
-    # Service discovery views
-    if options.get(CONF_DISCOVERY_SERVICES) and RESOURCE_SERVICES not in _REGISTERED_VIEWS:
-        hass.http.register_view(ServiceListView())
-        hass.http.register_view(DomainServiceListView())
-        hass.http.register_view(ServiceDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_SERVICES)
-        _LOGGER.info("Registered service discovery API endpoints at /api/config_mcp/services")
+    for resource, group in _VIEW_GROUPS.items():
+        if resource in _REGISTERED_VIEWS or not any(
+            options.get(option) for option in group.options
+        ):
+            continue
+        for view_cls in group.views:
+            view = view_cls(hass) if group.pass_hass else view_cls()
+            hass.http.register_view(view)
+        _REGISTERED_VIEWS.add(resource)
+        _LOGGER.info("Registered %s", group.endpoints)
 
     # MCP Server
     if options.get(CONF_MCP_SERVER) and "mcp_server" not in _REGISTERED_VIEWS:
@@ -411,92 +566,3 @@ def _register_views(hass: HomeAssistant, options: dict[str, Any]) -> None:
             # Clear the restart required repair since OAuth is now active
             from homeassistant.helpers import issue_registry as ir
             ir.async_delete_issue(hass, DOMAIN, "oauth_restart_required")
-
-    # Automation views (if any automation permission is enabled)
-    automations_enabled = (
-        options.get(CONF_AUTOMATIONS_READ) or
-        options.get(CONF_AUTOMATIONS_CREATE) or
-        options.get(CONF_AUTOMATIONS_UPDATE) or
-        options.get(CONF_AUTOMATIONS_DELETE)
-    )
-    if automations_enabled and RESOURCE_AUTOMATIONS not in _REGISTERED_VIEWS:
-        hass.http.register_view(AutomationListView())
-        hass.http.register_view(AutomationDetailView())
-        hass.http.register_view(AutomationTriggerView())
-        _REGISTERED_VIEWS.add(RESOURCE_AUTOMATIONS)
-        _LOGGER.info("Registered automation API endpoints at /api/config_mcp/automations")
-
-    # Script views (if any script permission is enabled)
-    scripts_enabled = (
-        options.get(CONF_SCRIPTS_READ) or
-        options.get(CONF_SCRIPTS_CREATE) or
-        options.get(CONF_SCRIPTS_UPDATE) or
-        options.get(CONF_SCRIPTS_DELETE)
-    )
-    if scripts_enabled and RESOURCE_SCRIPTS not in _REGISTERED_VIEWS:
-        hass.http.register_view(ScriptListView())
-        hass.http.register_view(ScriptDetailView())
-        hass.http.register_view(ScriptRunView())
-        hass.http.register_view(ScriptStopView())
-        _REGISTERED_VIEWS.add(RESOURCE_SCRIPTS)
-        _LOGGER.info("Registered script API endpoints at /api/config_mcp/scripts")
-
-    # Scene views (if any scene permission is enabled)
-    scenes_enabled = (
-        options.get(CONF_SCENES_READ) or
-        options.get(CONF_SCENES_CREATE) or
-        options.get(CONF_SCENES_UPDATE) or
-        options.get(CONF_SCENES_DELETE)
-    )
-    if scenes_enabled and RESOURCE_SCENES not in _REGISTERED_VIEWS:
-        hass.http.register_view(SceneListView())
-        hass.http.register_view(SceneDetailView())
-        hass.http.register_view(SceneActivateView())
-        _REGISTERED_VIEWS.add(RESOURCE_SCENES)
-        _LOGGER.info("Registered scene API endpoints at /api/config_mcp/scenes")
-
-    # Log views (if log reading is enabled)
-    if options.get(CONF_LOGS_READ) and RESOURCE_LOGS not in _REGISTERED_VIEWS:
-        hass.http.register_view(LogListView())
-        hass.http.register_view(LogErrorsView())
-        _REGISTERED_VIEWS.add(RESOURCE_LOGS)
-        _LOGGER.info("Registered log API endpoints at /api/config_mcp/logs")
-
-    # Category views (if any category permission is enabled)
-    categories_enabled = (
-        options.get(CONF_CATEGORIES_READ) or
-        options.get(CONF_CATEGORIES_CREATE) or
-        options.get(CONF_CATEGORIES_UPDATE) or
-        options.get(CONF_CATEGORIES_DELETE)
-    )
-    if categories_enabled and RESOURCE_CATEGORIES not in _REGISTERED_VIEWS:
-        hass.http.register_view(CategoryScopeListView())
-        hass.http.register_view(CategoryDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_CATEGORIES)
-        _LOGGER.info("Registered category API endpoints at /api/config_mcp/categories")
-
-    # Label views (if any label permission is enabled)
-    labels_enabled = (
-        options.get(CONF_LABELS_READ) or
-        options.get(CONF_LABELS_CREATE) or
-        options.get(CONF_LABELS_UPDATE) or
-        options.get(CONF_LABELS_DELETE)
-    )
-    if labels_enabled and RESOURCE_LABELS not in _REGISTERED_VIEWS:
-        hass.http.register_view(LabelListView())
-        hass.http.register_view(LabelDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_LABELS)
-        _LOGGER.info("Registered label API endpoints at /api/config_mcp/labels")
-
-    # Helper views (if any helper permission is enabled)
-    helpers_enabled = (
-        options.get(CONF_HELPERS_READ) or
-        options.get(CONF_HELPERS_CREATE) or
-        options.get(CONF_HELPERS_UPDATE) or
-        options.get(CONF_HELPERS_DELETE)
-    )
-    if helpers_enabled and RESOURCE_HELPERS not in _REGISTERED_VIEWS:
-        hass.http.register_view(HelperListView())
-        hass.http.register_view(HelperDetailView())
-        _REGISTERED_VIEWS.add(RESOURCE_HELPERS)
-        _LOGGER.info("Registered helper API endpoints at /api/config_mcp/helpers")
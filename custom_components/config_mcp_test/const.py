@@ -212,6 +212,9 @@ LOVELACE_DATA = "lovelace"
 MODE_STORAGE = "storage"
 MODE_YAML = "yaml"
 
+# Largest JSON request body accepted by the dashboard API (bytes)
+MAX_DASHBOARD_BODY_SIZE = 4 * 1024 * 1024
+
 # Configuration keys
 CONF_URL_PATH = "url_path"
 CONF_TITLE = "title"
@@ -226,6 +229,7 @@ ERR_INVALID_CONFIG = "invalid_config"
 ERR_YAML_DASHBOARD = "yaml_dashboard_readonly"
 ERR_DEFAULT_DASHBOARD = "default_dashboard_protected"
 ERR_INVALID_ENTITIES = "invalid_entities"
+ERR_BODY_TOO_LARGE = "body_too_large"
 
 # Error codes - Discovery
 ERR_ENTITY_NOT_FOUND = "entity_not_found"
@@ -270,7 +274,19 @@ ERR_LABEL_EXISTS = "label_already_exists"
 
 # Data keys for hass.data storage
 DATA_DASHBOARDS_COLLECTION = f"{DOMAIN}_dashboards_collection"
+DATA_DASHBOARDS_URL_INDEX = f"{DOMAIN}_dashboards_url_index"
+DATA_DASHBOARDS_COLLECTION_LOADED = f"{DOMAIN}_dashboards_collection_loaded"
+DATA_DASHBOARDS_LOAD_LOCK = f"{DOMAIN}_dashboards_load_lock"
+DATA_DASHBOARDS_LIST_CACHE = f"{DOMAIN}_dashboards_list_cache"
+DATA_DASHBOARDS_LIST_GENERATION = f"{DOMAIN}_dashboards_list_generation"
+DATA_DASHBOARDS_CONFIG_CACHE = f"{DOMAIN}_dashboards_config_cache"
+DATA_DASHBOARDS_INFO_CACHE = f"{DOMAIN}_dashboards_info_cache"
 DATA_AUTOMATIONS_COMPONENT = f"{DOMAIN}_automations_component"
+DATA_SERVICES_CACHE = f"{DOMAIN}_services_cache"
+DATA_PERMISSION_CACHE = f"{DOMAIN}_permission_cache"
+DATA_SCRIPTS_RELOAD = f"{DOMAIN}_scripts_reload"
+DATA_SCRIPTS_YAML_CACHE = f"{DOMAIN}_scripts_yaml_cache"
+DATA_SCRIPTS_WRITE_LOCK = f"{DOMAIN}_scripts_write_lock"
 
 # MCP Server configuration
 API_BASE_PATH_MCP = "/api/config_mcp/mcp"
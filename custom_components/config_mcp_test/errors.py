@@ -36,3 +36,21 @@ class InvalidConfigError(HomeAssistantError):
     def __init__(self, message: str) -> None:
         """Initialize exception."""
         super().__init__(message)
+
+
+class ScriptNotFoundError(HomeAssistantError):
+    """Raised when a script is not found in scripts.yaml."""
+
+    def __init__(self, script_id: str) -> None:
+        """Initialize exception."""
+        super().__init__(f"Script '{script_id}' not found")
+        self.script_id = script_id
+
+
+class ScriptExistsError(HomeAssistantError):
+    """Raised when a script already exists in scripts.yaml."""
+
+    def __init__(self, script_id: str) -> None:
+        """Initialize exception."""
+        super().__init__(f"Script with id '{script_id}' already exists")
+        self.script_id = script_id
@@ -15,29 +15,56 @@ discover authentication endpoints.
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import hashlib
 import logging
+import time
 from dataclasses import dataclass
 from http import HTTPStatus
 from typing import Any
 
 import anyio
-from aiohttp import web
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from aiohttp import hdrs, web
+import jwt
 from mcp.server import Server
+from mcp.server.models import InitializationOptions
 from mcp.shared.message import SessionMessage
 from mcp.types import JSONRPCMessage
+from pydantic import TypeAdapter
 
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.const import CONTENT_TYPE_JSON
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 
 from .const import API_BASE_PATH_MCP, OAUTH_METADATA_PATH
 from .mcp_server import create_mcp_server
+from .oauth import is_oidc_available, validate_oauth_token
 
 _LOGGER = logging.getLogger(__name__)
 
 # Request timeout in seconds
 REQUEST_TIMEOUT = 120
 
+# Maximum number of base URLs to keep serialized OAuth metadata for. The base
+# URL comes from client-supplied headers, so the cache must stay bounded.
+OAUTH_METADATA_CACHE_SIZE = 16
+
+# How long (seconds) and for how many tokens a successful HA access token
+# validation is remembered
+TOKEN_CACHE_TTL = 30
+TOKEN_CACHE_SIZE = 1024
+
+# How long (seconds) and for how many tokens verified OAuth JWT claims are
+# remembered. Entries never outlive the token's exp claim.
+OAUTH_CLAIMS_CACHE_TTL = 60
+OAUTH_CLAIMS_CACHE_SIZE = 4096
+
+# Building a TypeAdapter compiles the validator, so do it once at import
+_JSONRPC_MESSAGE_ADAPTER: TypeAdapter[JSONRPCMessage] = TypeAdapter(JSONRPCMessage)
+
 
 @dataclass
 class Streams:
@@ -47,10 +74,21 @@ class Streams:
     HTTP handlers write to read_stream_writer and read from write_stream_reader.
     """
 
-    read_stream: anyio.abc.ObjectReceiveStream[SessionMessage | Exception]
-    read_stream_writer: anyio.abc.ObjectSendStream[SessionMessage | Exception]
-    write_stream: anyio.abc.ObjectSendStream[SessionMessage]
-    write_stream_reader: anyio.abc.ObjectReceiveStream[SessionMessage]
+    read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
+    read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
+    write_stream: MemoryObjectSendStream[SessionMessage]
+    write_stream_reader: MemoryObjectReceiveStream[SessionMessage]
+
+    def close(self) -> None:
+        """Close all stream endpoints.
+
+        Memory object streams close synchronously and closing twice is a
+        no-op, so this needs no awaiting or error handling.
+        """
+        self.read_stream_writer.close()
+        self.read_stream.close()
+        self.write_stream.close()
+        self.write_stream_reader.close()
 
 
 def create_streams() -> Streams:
@@ -73,6 +111,70 @@ def create_streams() -> Streams:
     )
 
 
+def _token_cache_key(token: str) -> bytes:
+    """Return the cache key for a bearer token, so raw tokens are not kept."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _token_cache_deadline(expires: float | None, ttl: float) -> float | None:
+    """Return the monotonic time until which a validated token may be cached.
+
+    The deadline is ttl seconds from now, capped at the token's own expiry
+    (a Unix timestamp). Returns None if the token expires too soon to be
+    worth caching.
+    """
+    if expires is not None:
+        ttl = min(ttl, expires - time.time())
+    if ttl <= 0:
+        return None
+    return time.monotonic() + ttl
+
+
+def _token_cache_store(
+    cache: dict[bytes, tuple[Any, ...]],
+    token_key: bytes,
+    entry: tuple[Any, ...],
+    max_size: int,
+) -> None:
+    """Store a (deadline, ...) entry, evicting expired and then oldest entries."""
+    if len(cache) >= max_size:
+        now = time.monotonic()
+        for key in [key for key, cached in cache.items() if cached[0] <= now]:
+            del cache[key]
+        if len(cache) >= max_size:
+            del cache[next(iter(cache))]
+    cache[token_key] = entry
+
+
+def _get_token_algorithm(token: str) -> str | None:
+    """Return the signing algorithm from a JWT's unverified header."""
+    try:
+        return jwt.get_unverified_header(token).get("alg")
+    except jwt.InvalidTokenError:
+        return None
+
+
+def _get_base_url_from_request(request: web.Request) -> str | None:
+    """Get the base URL from the request.
+
+    Tries to determine the external URL from request headers,
+    falling back to the Host header.
+    """
+    # Check for forwarded headers (reverse proxy)
+    headers = request.headers
+    if forwarded_host := headers.get(hdrs.X_FORWARDED_HOST):
+        forwarded_proto = headers.get(hdrs.X_FORWARDED_PROTO, "https")
+        return f"{forwarded_proto}://{forwarded_host}"
+
+    # Fall back to Host header
+    if host := headers.get(hdrs.HOST):
+        # Determine scheme from request
+        scheme = "https" if request.secure else "http"
+        return f"{scheme}://{host}"
+
+    return None
+
+
 class MCPOAuthMetadataView(HomeAssistantView):
     """View providing OAuth metadata for MCP clients.
 
@@ -91,6 +193,8 @@ class MCPOAuthMetadataView(HomeAssistantView):
     def __init__(self, hass: HomeAssistant):
         """Initialize the view."""
         self._hass = hass
+        # base_url -> serialized metadata, evicted oldest-first
+        self._metadata_cache: dict[str, bytes] = {}
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle GET request - return OAuth metadata.
@@ -98,68 +202,49 @@ class MCPOAuthMetadataView(HomeAssistantView):
         Returns OAuth Authorization Server Metadata (RFC 8414) pointing
         to the hass-oidc-auth endpoints.
         """
-        from .oauth import is_oidc_available
-
         if not is_oidc_available(self._hass):
-            return web.json_response(
+            return self.json(
                 {"error": "OAuth not available - hass-oidc-auth not configured"},
-                status=HTTPStatus.SERVICE_UNAVAILABLE,
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE,
             )
 
         # Get base URL from request (same approach as OIDC provider)
-        base_url = self._get_base_url_from_request(request)
+        base_url = _get_base_url_from_request(request)
         if not base_url:
-            return web.json_response(
+            return self.json(
                 {"error": "Could not determine base URL"},
-                status=HTTPStatus.INTERNAL_SERVER_ERROR,
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
             )
 
-        # Build OAuth metadata pointing to OIDC provider endpoints
-        metadata = {
-            "issuer": f"{base_url}/oidc",
-            "authorization_endpoint": f"{base_url}/oidc/authorize",
-            "token_endpoint": f"{base_url}/oidc/token",
-            "registration_endpoint": f"{base_url}/oidc/register",
-            "jwks_uri": f"{base_url}/oidc/jwks",
-            "userinfo_endpoint": f"{base_url}/oidc/userinfo",
-            "scopes_supported": ["openid", "profile", "email"],
-            "response_types_supported": ["code"],
-            "grant_types_supported": ["authorization_code", "refresh_token"],
-            "code_challenge_methods_supported": ["S256"],
-            "token_endpoint_auth_methods_supported": ["client_secret_basic", "client_secret_post"],
-        }
-
-        return web.json_response(metadata)
-
-    def _get_base_url_from_request(self, request: web.Request) -> str | None:
-        """Get the base URL from the request.
-
-        Tries to determine the external URL from request headers,
-        falling back to the Host header.
-        """
-        # Check for forwarded headers (reverse proxy)
-        forwarded_proto = request.headers.get("X-Forwarded-Proto", "https")
-        forwarded_host = request.headers.get("X-Forwarded-Host")
-
-        if forwarded_host:
-            return f"{forwarded_proto}://{forwarded_host}"
-
-        # Fall back to Host header
-        host = request.headers.get("Host")
-        if host:
-            # Determine scheme from request
-            scheme = "https" if request.secure else "http"
-            return f"{scheme}://{host}"
-
-        return None
+        payload = self._metadata_cache.get(base_url)
+        if payload is None:
+            # Build OAuth metadata pointing to OIDC provider endpoints
+            payload = json_bytes({
+                "issuer": f"{base_url}/oidc",
+                "authorization_endpoint": f"{base_url}/oidc/authorize",
+                "token_endpoint": f"{base_url}/oidc/token",
+                "registration_endpoint": f"{base_url}/oidc/register",
+                "jwks_uri": f"{base_url}/oidc/jwks",
+                "userinfo_endpoint": f"{base_url}/oidc/userinfo",
+                "scopes_supported": ["openid", "profile", "email"],
+                "response_types_supported": ["code"],
+                "grant_types_supported": ["authorization_code", "refresh_token"],
+                "code_challenge_methods_supported": ["S256"],
+                "token_endpoint_auth_methods_supported": ["client_secret_basic", "client_secret_post"],
+            })
+            if len(self._metadata_cache) >= OAUTH_METADATA_CACHE_SIZE:
+                del self._metadata_cache[next(iter(self._metadata_cache))]
+            self._metadata_cache[base_url] = payload
+
+        return web.Response(body=payload, content_type=CONTENT_TYPE_JSON)
 
 
 class MCPStreamableView(HomeAssistantView):
     """View implementing MCP Streamable HTTP transport with OAuth support.
 
-    This provides a stateless HTTP endpoint where each request creates
-    a fresh MCP server instance, processes one message, and returns
-    the response.
+    This provides a stateless HTTP endpoint where each request runs the
+    shared MCP server over fresh streams, processes one message, and
+    returns the response.
 
     Authentication:
     - When oauth_enabled=False: Uses standard HA Bearer token auth
@@ -179,11 +264,29 @@ class MCPStreamableView(HomeAssistantView):
         """
         self._hass = hass
         self._oauth_enabled = oauth_enabled
+        # The MCP server holds no per-session state in stateless mode, so a
+        # single instance is built on first use and shared by all requests
+        self._server: Server | None = None
+        self._init_options: InitializationOptions | None = None
+        # token hash -> (deadline, refresh token id) for validated HA tokens
+        self._ha_token_cache: dict[bytes, tuple[float, str]] = {}
+        # token hash -> (deadline, claims) for verified OAuth tokens
+        self._oauth_claims_cache: dict[bytes, tuple[float, dict[str, Any]]] = {}
+
+    def _get_server(self) -> tuple[Server, InitializationOptions]:
+        """Return the shared MCP server and its initialization options."""
+        if self._server is None:
+            self._server = create_mcp_server(self._hass)
+            self._init_options = self._server.create_initialization_options()
+            _LOGGER.debug("MCP server created")
+
+        return self._server, self._init_options
 
     async def _validate_request(self, request: web.Request) -> tuple[bool, str | None]:
         """Validate the request authentication.
 
-        Tries HA's built-in token validation first, then OAuth if enabled.
+        Uses HA's built-in token validation, or OAuth validation if enabled
+        and the token is not an HA access token.
 
         Args:
             request: The incoming request
@@ -191,47 +294,95 @@ class MCPStreamableView(HomeAssistantView):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # Get authorization header
-        auth_header = request.headers.get("Authorization", "")
-        if not auth_header.startswith("Bearer "):
+        # Get authorization header (the scheme is case-insensitive, RFC 6750)
+        auth_header = request.headers.get(hdrs.AUTHORIZATION, "")
+        scheme, _, token = auth_header.partition(" ")
+        token = token.strip()
+        if not token or scheme.lower() != "bearer":
             return False, "Missing or invalid Authorization header"
+        token_key = _token_cache_key(token)
+
+        # A recently validated HA token skips the JWT decode and signature
+        # check, but its refresh token must still exist and its user must
+        # still be active, so revocations take effect immediately
+        if (cached := self._ha_token_cache.get(token_key)) is not None:
+            deadline, refresh_token_id = cached
+            refresh_token = self._hass.auth.async_get_refresh_token(refresh_token_id)
+            if (
+                deadline > time.monotonic()
+                and refresh_token is not None
+                and refresh_token.user.is_active
+            ):
+                return True, None
+            del self._ha_token_cache[token_key]
 
-        token = auth_header[7:]  # Strip "Bearer " prefix
-
-        # First, try standard HA long-lived access token validation
+        if self._oauth_enabled:
+            # JWT signature verification is expensive; a token verified
+            # recently is accepted from the cache until its deadline
+            if (cached := self._oauth_claims_cache.get(token_key)) is not None:
+                deadline, claims = cached
+                if deadline > time.monotonic():
+                    request["oauth_claims"] = claims
+                    return True, None
+                del self._oauth_claims_cache[token_key]
+
+            # HA signs its access tokens with HS256 and hass-oidc-auth tokens
+            # are RS256, so only one of the validators can accept a token
+            if _get_token_algorithm(token) != "HS256":
+                claims = await validate_oauth_token(self._hass, token)
+                if claims is not None:
+                    # Store claims in request for potential use
+                    request["oauth_claims"] = claims
+                    _LOGGER.debug("Request authenticated via OAuth token")
+                    self._cache_oauth_claims(token_key, claims)
+                    return True, None
+                return False, "Invalid authentication token"
+
+        # Standard HA long-lived access token validation
         try:
             # Validate as a long-lived access token (sync method despite async_ prefix)
             refresh_token = self._hass.auth.async_validate_access_token(token)
-            if refresh_token is not None:
-                _LOGGER.debug("Request authenticated via HA access token")
-                return True, None
         except Exception as err:
             _LOGGER.debug("HA token validation failed: %s", err)
+            refresh_token = None
 
-        # If OAuth is enabled, try OAuth token validation
-        if self._oauth_enabled:
-            from .oauth import validate_oauth_token
+        if refresh_token is None:
+            return False, "Invalid authentication token"
 
-            claims = await validate_oauth_token(self._hass, token)
-            if claims is not None:
-                # Store claims in request for potential use
-                request["oauth_claims"] = claims
-                _LOGGER.debug("Request authenticated via OAuth token")
-                return True, None
+        _LOGGER.debug("Request authenticated via HA access token")
+        self._cache_ha_token(token_key, token, refresh_token.id)
+        return True, None
 
-        return False, "Invalid authentication token"
-
-    def _get_base_url_from_request(self, request: web.Request) -> str | None:
-        """Get the base URL from the request."""
-        forwarded_proto = request.headers.get("X-Forwarded-Proto", "https")
-        forwarded_host = request.headers.get("X-Forwarded-Host")
-        if forwarded_host:
-            return f"{forwarded_proto}://{forwarded_host}"
-        host = request.headers.get("Host")
-        if host:
-            scheme = "https" if request.secure else "http"
-            return f"{scheme}://{host}"
-        return None
+    def _cache_ha_token(self, token_key: bytes, token: str, refresh_token_id: str) -> None:
+        """Remember a successfully validated HA access token.
+
+        Caching is best effort: a token whose claims cannot be read is simply
+        not cached, it is never rejected here.
+        """
+        try:
+            claims = jwt.decode(token, options={"verify_signature": False})
+        except jwt.InvalidTokenError:
+            return
+        expires = claims.get("exp")
+        deadline = _token_cache_deadline(expires, TOKEN_CACHE_TTL)
+        if deadline is not None:
+            _token_cache_store(
+                self._ha_token_cache,
+                token_key,
+                (deadline, refresh_token_id),
+                TOKEN_CACHE_SIZE,
+            )
+
+    def _cache_oauth_claims(self, token_key: bytes, claims: dict[str, Any]) -> None:
+        """Remember the claims of a successfully verified OAuth token."""
+        deadline = _token_cache_deadline(claims.get("exp"), OAUTH_CLAIMS_CACHE_TTL)
+        if deadline is not None:
+            _token_cache_store(
+                self._oauth_claims_cache,
+                token_key,
+                (deadline, claims),
+                OAUTH_CLAIMS_CACHE_SIZE,
+            )
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle GET request - SSE endpoint for MCP Streamable HTTP.
@@ -250,7 +401,7 @@ class MCPStreamableView(HomeAssistantView):
             )
 
         # SSE streaming not supported in stateless mode
-        return web.json_response(
+        return self.json(
             {
                 "jsonrpc": "2.0",
                 "error": {
@@ -258,27 +409,27 @@ class MCPStreamableView(HomeAssistantView):
                     "message": "SSE streaming not supported. Use POST for requests.",
                 },
             },
-            status=HTTPStatus.OK,
+            status_code=HTTPStatus.OK,
         )
 
     async def post(self, request: web.Request) -> web.Response:
         """Handle POST request - process a JSON-RPC message.
 
-        Each request creates a new MCP server instance, sends the message,
-        waits for a response, and returns it.
+        Each request runs the shared MCP server over its own streams, sends
+        the message, waits for a response, and returns it.
         """
         # Validate authentication
         is_valid, error = await self._validate_request(request)
         if not is_valid:
             # If OAuth is enabled, include WWW-Authenticate header with metadata location
             if self._oauth_enabled:
-                base_url = self._get_base_url_from_request(request)
+                base_url = _get_base_url_from_request(request)
                 if base_url:
                     # RFC 9728 - OAuth 2.0 Protected Resource Metadata
                     metadata_url = f"{base_url}/.well-known/oauth-authorization-server/oidc"
-                    return web.json_response(
+                    return self.json(
                         {"message": error or "Unauthorized"},
-                        status=HTTPStatus.UNAUTHORIZED,
+                        status_code=HTTPStatus.UNAUTHORIZED,
                         headers={
                             "WWW-Authenticate": f'Bearer resource_metadata="{metadata_url}"',
                         },
@@ -289,8 +440,10 @@ class MCPStreamableView(HomeAssistantView):
             )
 
         try:
-            body = await request.json()
-        except (ValueError, json.JSONDecodeError):
+            # orjson parses the raw bytes directly, skipping the UTF-8 decode
+            # to str that request.json() does first
+            body = json_loads(await request.read())
+        except ValueError:
             return self.json_message(
                 "Invalid JSON in request body",
                 HTTPStatus.BAD_REQUEST,
@@ -303,15 +456,18 @@ class MCPStreamableView(HomeAssistantView):
                 HTTPStatus.BAD_REQUEST,
             )
 
-        try:
-            # Create the MCP server
-            server = create_mcp_server(self._hass)
-            _LOGGER.debug("MCP server created for request")
+        # Notifications expect no reply and a stateless server has no session
+        # state for them to act on, so acknowledge them without running it
+        method = body.get("method")
+        if (
+            "id" not in body
+            and isinstance(method, str)
+            and method.startswith("notifications/")
+        ):
+            return web.Response(status=HTTPStatus.ACCEPTED)
 
-            # Get initialization options (run in executor to avoid blocking)
-            init_options = await self._hass.async_add_executor_job(
-                server.create_initialization_options
-            )
+        try:
+            server, init_options = self._get_server()
 
             # Create streams for this request
             streams = create_streams()
@@ -320,61 +476,38 @@ class MCPStreamableView(HomeAssistantView):
             message = _parse_message(body)
 
             async with asyncio.timeout(REQUEST_TIMEOUT):
+                # Start the server in the background (stateless mode); it
+                # only ever handles this one message
+                server_task = asyncio.create_task(
+                    _run_server(server, streams, init_options)
+                )
                 try:
-                    async with anyio.create_task_group() as tg:
-                        # Start the server in the background (stateless mode)
-                        async def run_server() -> None:
-                            try:
-                                await server.run(
-                                    streams.read_stream,
-                                    streams.write_stream,
-                                    init_options,
-                                    raise_exceptions=True,
-                                    stateless=True,
-                                )
-                            except anyio.EndOfStream:
-                                _LOGGER.debug("MCP server: read stream ended")
-                            except anyio.ClosedResourceError:
-                                _LOGGER.debug("MCP server: stream closed")
-                            except Exception as e:
-                                _LOGGER.debug("MCP server ended: %s", e)
-
-                        tg.start_soon(run_server)
-
-                        # Send the message to the server (wrapped in SessionMessage)
-                        session_message = SessionMessage(message=message)
-                        _LOGGER.debug("Sending message to MCP server")
-                        await streams.read_stream_writer.send(session_message)
-                        _LOGGER.debug("Message sent to MCP server")
-
-                        # Wait for response (only for requests, not notifications)
-                        if "id" in body:
-                            _LOGGER.debug("Waiting for response from MCP server")
-                            response_session_msg = await streams.write_stream_reader.receive()
-                            _LOGGER.debug("Response received from MCP server")
-                            # Server will exit naturally now that input is closed;
-                            # cancel scope to unblock task group exit
-                            tg.cancel_scope.cancel()
-                            return web.json_response(
-                                _serialize_message(response_session_msg.message)
-                            )
-                        else:
-                            # Notification - no response expected
-                            tg.cancel_scope.cancel()
-                            return web.Response(status=HTTPStatus.ACCEPTED)
+                    # Send the message to the server (wrapped in SessionMessage)
+                    session_message = SessionMessage(message=message)
+                    _LOGGER.debug("Sending message to MCP server")
+                    await streams.read_stream_writer.send(session_message)
+                    _LOGGER.debug("Message sent to MCP server")
+
+                    # Wait for response (only for requests, not notifications)
+                    if "id" in body:
+                        _LOGGER.debug("Waiting for response from MCP server")
+                        response_session_msg = await streams.write_stream_reader.receive()
+                        _LOGGER.debug("Response received from MCP server")
+                        return web.Response(
+                            body=_serialize_message(response_session_msg.message),
+                            content_type=CONTENT_TYPE_JSON,
+                        )
+
+                    # Notification - no response expected
+                    return web.Response(status=HTTPStatus.ACCEPTED)
                 finally:
+                    server_task.cancel()
+                    # Let the server finish unwinding before its streams go away
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await server_task
                     # Ensure all stream endpoints are closed to prevent
                     # resource leaks, even if an exception occurred
-                    for stream in (
-                        streams.read_stream_writer,
-                        streams.read_stream,
-                        streams.write_stream,
-                        streams.write_stream_reader,
-                    ):
-                        try:
-                            await stream.aclose()
-                        except Exception:
-                            pass
+                    streams.close()
                     _LOGGER.debug("All MCP streams closed")
 
         except asyncio.TimeoutError:
@@ -390,6 +523,26 @@ class MCPStreamableView(HomeAssistantView):
             )
 
 
+async def _run_server(
+    server: Server, streams: Streams, init_options: InitializationOptions
+) -> None:
+    """Run the MCP server over one request's streams until it is cancelled."""
+    try:
+        await server.run(
+            streams.read_stream,
+            streams.write_stream,
+            init_options,
+            raise_exceptions=True,
+            stateless=True,
+        )
+    except anyio.EndOfStream:
+        _LOGGER.debug("MCP server: read stream ended")
+    except anyio.ClosedResourceError:
+        _LOGGER.debug("MCP server: stream closed")
+    except Exception as e:
+        _LOGGER.debug("MCP server ended: %s", e)
+
+
 def _parse_message(data: dict[str, Any]) -> JSONRPCMessage:
     """Parse a JSON-RPC message from raw data.
 
@@ -399,31 +552,20 @@ def _parse_message(data: dict[str, Any]) -> JSONRPCMessage:
     Returns:
         Parsed JSONRPCMessage (with root wrapper)
     """
-    from pydantic import TypeAdapter
-
     # Use TypeAdapter to properly parse into JSONRPCMessage with root wrapper
-    adapter = TypeAdapter(JSONRPCMessage)
-    return adapter.validate_python(data)
+    return _JSONRPC_MESSAGE_ADAPTER.validate_python(data)
+
 
+def _serialize_message(message: JSONRPCMessage) -> bytes:
+    """Serialize a JSONRPCMessage to a JSON response body.
 
-def _serialize_message(message: JSONRPCMessage) -> dict[str, Any]:
-    """Serialize a JSONRPCMessage to a dict for JSON response.
+    The shared adapter has pydantic-core write JSON bytes directly, without
+    building an intermediate tree of dicts or a str first.
 
     Args:
         message: The message to serialize
 
     Returns:
-        Dict representation
+        JSON encoded message
     """
-    if hasattr(message, "model_dump"):
-        return message.model_dump(exclude_none=True, by_alias=True)
-    elif hasattr(message, "dict"):
-        return message.dict(exclude_none=True, by_alias=True)
-    else:
-        # Fallback
-        return {
-            "jsonrpc": "2.0",
-            "id": getattr(message, "id", None),
-            "result": getattr(message, "result", None),
-            "error": getattr(message, "error", None),
-        }
+    return _JSONRPC_MESSAGE_ADAPTER.dump_json(message, exclude_none=True, by_alias=True)
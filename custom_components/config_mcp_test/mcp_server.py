@@ -23,6 +23,7 @@ from .const import (
     DEFAULT_OPTIONS,
     DOMAIN,
     MCP_SERVER_NAME,
+    MCP_SERVER_VERSION,
 )
 from .mcp_registry import get_registered_tools, call_tool as registry_call_tool
 
@@ -43,10 +44,9 @@ def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
     # Get options from config entry
     if DOMAIN in hass.data:
         for entry_id in hass.data[DOMAIN]:
-            for entry in hass.config_entries.async_entries(DOMAIN):
-                if entry.entry_id == entry_id:
-                    options.update(entry.options)
-                    break
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is not None:
+                options.update(entry.options)
 
     return options
 
@@ -92,7 +92,9 @@ def create_mcp_server(hass: HomeAssistant) -> Server:
 
     _LOGGER.debug("MCP server using %d registered tools", current_count)
 
-    server = Server(MCP_SERVER_NAME)
+    # An explicit version keeps create_initialization_options() from looking
+    # up the mcp package version on disk, so it is safe to call in the loop
+    server = Server(MCP_SERVER_NAME, version=MCP_SERVER_VERSION)
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
@@ -11,6 +11,7 @@ import time
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import OIDC_DOMAIN
 
@@ -122,23 +123,22 @@ async def fetch_jwks(hass: HomeAssistant) -> dict[str, Any] | None:
 
     jwks_uri = f"{base_url}/oidc/jwks"
 
+    # Reuse HA's shared, pooled session; verify_ssl=False for local/self-signed connections
+    session = async_get_clientsession(hass, verify_ssl=False)
+
     try:
-        from aiohttp import ClientSession
-
-        async with ClientSession() as session:
-            # Use verify_ssl=False for local/self-signed connections
-            async with session.get(jwks_uri, ssl=False) as response:
-                if response.status == 200:
-                    _jwks_cache = await response.json()
-                    _jwks_cache_time = current_time
-                    _LOGGER.debug("Fetched JWKS from %s", jwks_uri)
-                    return _jwks_cache
-                else:
-                    _LOGGER.warning(
-                        "Failed to fetch JWKS from %s: HTTP %s",
-                        jwks_uri,
-                        response.status,
-                    )
+        async with session.get(jwks_uri) as response:
+            if response.status == 200:
+                _jwks_cache = await response.json()
+                _jwks_cache_time = current_time
+                _LOGGER.debug("Fetched JWKS from %s", jwks_uri)
+                return _jwks_cache
+            else:
+                _LOGGER.warning(
+                    "Failed to fetch JWKS from %s: HTTP %s",
+                    jwks_uri,
+                    response.status,
+                )
     except Exception as err:
         _LOGGER.warning("Failed to fetch JWKS: %s", err)
 
@@ -33,10 +33,9 @@ def _get_config_options(hass: HomeAssistant) -> dict[str, Any]:
     options = DEFAULT_OPTIONS.copy()
     if DOMAIN in hass.data:
         for entry_id in hass.data[DOMAIN]:
-            for entry in hass.config_entries.async_entries(DOMAIN):
-                if entry.entry_id == entry_id:
-                    options.update(entry.options)
-                    break
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is not None:
+                options.update(entry.options)
     return options
 
 
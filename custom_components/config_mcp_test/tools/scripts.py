@@ -11,12 +11,12 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
+from ..errors import ScriptExistsError, ScriptNotFoundError
 from ..mcp_registry import mcp_tool
 from ..views.scripts import (
     get_script_component,
     _format_script,
-    _load_script_config,
-    _save_script_config,
+    _mutate_script_config,
     _reload_scripts,
     _cleanup_entity_registry,
     validate_sequence,
@@ -126,10 +126,6 @@ async def create_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
         script_id = arguments["alias"].lower().replace(" ", "_").replace("-", "_")
         script_id = "".join(c for c in script_id if c.isalnum() or c == "_")
 
-    scripts = await _load_script_config(hass)
-    if script_id in scripts:
-        raise ValueError(f"Script with id '{script_id}' already exists")
-
     new_script: dict[str, Any] = {}
     for field in ["alias", "description", "icon", "mode", "max", "max_exceeded", "fields", "variables"]:
         if field in arguments:
@@ -141,8 +137,15 @@ async def create_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     if sequence_errors:
         raise ValueError("Invalid actions in sequence:\n" + "\n".join(sequence_errors))
 
-    scripts[script_id] = new_script
-    await _save_script_config(hass, scripts)
+    def add_script(scripts: dict[str, dict]) -> None:
+        if script_id in scripts:
+            raise ScriptExistsError(script_id)
+        scripts[script_id] = new_script
+
+    try:
+        await _mutate_script_config(hass, add_script)
+    except ScriptExistsError as err:
+        raise ValueError(f"Script with id '{script_id}' already exists") from err
     await _reload_scripts(hass)
 
     return {"id": script_id, "entity_id": f"script.{script_id}", "message": "Script created"}
@@ -173,10 +176,6 @@ async def update_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     """Full update of a script."""
     script_id = arguments["script_id"]
     clean_id = script_id.replace("script.", "")
-    scripts = await _load_script_config(hass)
-
-    if clean_id not in scripts:
-        raise ValueError(f"Script '{script_id}' not found")
 
     updated: dict[str, Any] = {}
     for field in ["alias", "description", "icon", "mode", "max", "max_exceeded", "fields", "variables"]:
@@ -189,8 +188,15 @@ async def update_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     if sequence_errors:
         raise ValueError("Invalid actions in sequence:\n" + "\n".join(sequence_errors))
 
-    scripts[clean_id] = updated
-    await _save_script_config(hass, scripts)
+    def replace_script(scripts: dict[str, dict]) -> None:
+        if clean_id not in scripts:
+            raise ScriptNotFoundError(clean_id)
+        scripts[clean_id] = updated
+
+    try:
+        await _mutate_script_config(hass, replace_script)
+    except ScriptNotFoundError as err:
+        raise ValueError(f"Script '{script_id}' not found") from err
     await _reload_scripts(hass)
 
     return {"id": clean_id, "entity_id": f"script.{clean_id}", "message": "Script updated"}
@@ -274,23 +280,24 @@ async def patch_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
     has_config_updates = any(field in arguments for field in config_fields)
 
     if has_config_updates:
-        scripts = await _load_script_config(hass)
-
-        if clean_id not in scripts:
-            raise ValueError(f"Script '{script_id}' not found in config")
-
-        updated = scripts[clean_id].copy()
-        for field in config_fields:
-            if field in arguments:
-                updated[field] = arguments[field]
-
         if "sequence" in arguments:
             sequence_errors = validate_sequence(hass, arguments["sequence"])
             if sequence_errors:
                 raise ValueError("Invalid actions in sequence:\n" + "\n".join(sequence_errors))
 
-        scripts[clean_id] = updated
-        await _save_script_config(hass, scripts)
+        def merge_script(scripts: dict[str, dict]) -> None:
+            # The scripts dict is a private copy, so merge in place
+            existing = scripts.get(clean_id)
+            if existing is None:
+                raise ScriptNotFoundError(clean_id)
+            for key in config_fields:
+                if key in arguments:
+                    existing[key] = arguments[key]
+
+        try:
+            await _mutate_script_config(hass, merge_script)
+        except ScriptNotFoundError as err:
+            raise ValueError(f"Script '{script_id}' not found in config") from err
         await _reload_scripts(hass)
         result_message.append("Config updated")
 
@@ -320,13 +327,16 @@ async def delete_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     script_id = arguments["script_id"]
     clean_id = script_id.replace("script.", "")
     entity_id = f"script.{clean_id}"
-    scripts = await _load_script_config(hass)
 
-    if clean_id not in scripts:
-        raise ValueError(f"Script '{script_id}' not found")
+    def remove_script(scripts: dict[str, dict]) -> None:
+        if clean_id not in scripts:
+            raise ScriptNotFoundError(clean_id)
+        del scripts[clean_id]
 
-    del scripts[clean_id]
-    await _save_script_config(hass, scripts)
+    try:
+        await _mutate_script_config(hass, remove_script)
+    except ScriptNotFoundError as err:
+        raise ValueError(f"Script '{script_id}' not found") from err
     await _reload_scripts(hass)
     await _cleanup_entity_registry(hass, entity_id)
 
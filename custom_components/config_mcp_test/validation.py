@@ -19,6 +19,12 @@ from .const import (
 )
 
 
+# Valid URL path: alphanumeric runs joined by at least one hyphen ([^\W_] is
+# str.isalnum() in regex form)
+URL_PATH_PATTERN = re.compile(r"[^\W_]+(?:-+[^\W_]+)+")
+URL_PATH_INVALID_CHAR_PATTERN = re.compile(r"[^\w-]|_")
+
+
 def validate_url_path(value: str) -> str:
     """Validate dashboard URL path.
 
@@ -27,6 +33,10 @@ def validate_url_path(value: str) -> str:
     - Use only lowercase alphanumeric characters and hyphens
     - Start and end with alphanumeric characters
     """
+    # Fast path for valid paths; the checks below only build the error message
+    if isinstance(value, str) and URL_PATH_PATTERN.fullmatch(value):
+        return value.lower()
+
     if not value:
         raise vol.Invalid("URL path cannot be empty")
 
@@ -35,7 +45,7 @@ def validate_url_path(value: str) -> str:
         raise vol.Invalid("URL path must contain a hyphen (-)")
 
     # Validate characters (lowercase, numbers, hyphens)
-    if not all(c.isalnum() or c == "-" for c in value):
+    if URL_PATH_INVALID_CHAR_PATTERN.search(value):
         raise vol.Invalid(
             "URL path must contain only lowercase letters, numbers, and hyphens"
         )
@@ -181,13 +191,14 @@ def extract_entity_references(config: Any, entities: set[str] | None = None) ->
                     for eid in target_entity:
                         if _is_entity_id(eid):
                             entities.add(eid)
-            # Recurse into nested structures
-            else:
+            # Recurse into nested structures (scalars hold no references)
+            elif isinstance(value, (dict, list)):
                 extract_entity_references(value, entities)
 
     elif isinstance(config, list):
         for item in config:
-            extract_entity_references(item, entities)
+            if isinstance(item, (dict, list)):
+                extract_entity_references(item, entities)
 
     return entities
 
@@ -12,6 +12,7 @@ from .automations import (
     AutomationTriggerView,
 )
 from .dashboards import (
+    DashboardBatchView,
     DashboardConfigView,
     DashboardDetailView,
     DashboardListView,
@@ -68,6 +69,7 @@ from .helpers import (
 __all__ = [
     # Dashboard views
     "DashboardListView",
+    "DashboardBatchView",
     "DashboardDetailView",
     "DashboardConfigView",
     # Automation views
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import uuid
 from http import HTTPStatus
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
@@ -14,6 +15,7 @@ from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.json import json_loads
 
 from ..const import (
     API_BASE_PATH_AUTOMATIONS,
@@ -38,6 +40,9 @@ _LOGGER = logging.getLogger(__name__)
 AUTOMATION_DOMAIN = "automation"
 AUTOMATION_DATA_COMPONENT = "automation"
 
+# Shared read-only fallback for trigger requests without a usable JSON body
+_EMPTY_BODY: MappingProxyType[str, Any] = MappingProxyType({})
+
 
 def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
     """Get the current configuration options for config_mcp.
@@ -52,13 +57,10 @@ def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
 
     # Get options from config entry
     if DOMAIN in hass.data:
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            # entry_data is the config entry data, we need the options
-            # Find the config entry by entry_id
-            for entry in hass.config_entries.async_entries(DOMAIN):
-                if entry.entry_id == entry_id:
-                    options.update(entry.options)
-                    break
+        for entry_id in hass.data[DOMAIN]:
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is not None:
+                options.update(entry.options)
 
     return options
 
@@ -355,7 +357,7 @@ class AutomationListView(HomeAssistantView):
             )
 
         try:
-            body = await request.json()
+            body = await request.json(loads=json_loads)
         except ValueError:
             return self.json_message(
                 "Invalid JSON in request body",
@@ -544,7 +546,7 @@ class AutomationDetailView(HomeAssistantView):
             )
 
         try:
-            body = await request.json()
+            body = await request.json(loads=json_loads)
         except ValueError:
             return self.json_message(
                 "Invalid JSON in request body",
@@ -675,7 +677,7 @@ class AutomationDetailView(HomeAssistantView):
             )
 
         try:
-            body = await request.json()
+            body = await request.json(loads=json_loads)
         except ValueError:
             return self.json_message(
                 "Invalid JSON in request body",
@@ -962,16 +964,16 @@ class AutomationTriggerView(HomeAssistantView):
 
         # Parse optional body for trigger parameters
         try:
-            body = await request.json()
+            body = await request.json(loads=json_loads)
         except ValueError:
-            body = {}
+            body = _EMPTY_BODY
 
         service_data = {"entity_id": entity_id}
 
         if body.get("skip_condition"):
             service_data["skip_condition"] = True
-        if body.get("variables"):
-            service_data["variables"] = body["variables"]
+        if variables := body.get("variables"):
+            service_data["variables"] = variables
 
         try:
             await hass.services.async_call(
@@ -14,6 +14,7 @@ from homeassistant.helpers import (
     category_registry as cr,
     label_registry as lr,
 )
+from homeassistant.util.json import json_loads
 
 from ..const import (
     API_BASE_PATH_CATEGORIES,
@@ -45,11 +46,10 @@ def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
     options = DEFAULT_OPTIONS.copy()
 
     if DOMAIN in hass.data:
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            for entry in hass.config_entries.async_entries(DOMAIN):
-                if entry.entry_id == entry_id:
-                    options.update(entry.options)
-                    break
+        for entry_id in hass.data[DOMAIN]:
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is not None:
+                options.update(entry.options)
 
     return options
 
@@ -71,6 +71,10 @@ class CategoryScopeListView(HomeAssistantView):
     name = "api:config_mcp:categories:scope"
     requires_auth = True
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with the category registry."""
+        self._category_registry = cr.async_get(hass)
+
     async def get(self, request: web.Request, scope: str) -> web.Response:
         """Handle GET request - list all categories for a scope.
 
@@ -97,7 +101,7 @@ class CategoryScopeListView(HomeAssistantView):
                 ERR_CATEGORY_INVALID_SCOPE,
             )
 
-        category_registry = cr.async_get(hass)
+        category_registry = self._category_registry
 
         categories = []
         for category in category_registry.async_list_categories(scope=scope):
@@ -155,7 +159,7 @@ class CategoryScopeListView(HomeAssistantView):
             )
 
         try:
-            body = await request.json()
+            body = await request.json(loads=json_loads)
         except ValueError:
             return self.json_message(
                 "Invalid JSON in request body",
@@ -173,16 +177,19 @@ class CategoryScopeListView(HomeAssistantView):
         name = body["name"]
         icon = body.get("icon")
 
-        category_registry = cr.async_get(hass)
+        category_registry = self._category_registry
 
         # Check if name already exists
-        for existing in category_registry.async_list_categories(scope=scope):
-            if existing.name.lower() == name.lower():
-                return self.json_message(
-                    f"Category with name '{name}' already exists in scope '{scope}'",
-                    HTTPStatus.CONFLICT,
-                    ERR_CATEGORY_EXISTS,
-                )
+        target = name.casefold()
+        if any(
+            existing.name.casefold() == target
+            for existing in category_registry.async_list_categories(scope=scope)
+        ):
+            return self.json_message(
+                f"Category with name '{name}' already exists in scope '{scope}'",
+                HTTPStatus.CONFLICT,
+                ERR_CATEGORY_EXISTS,
+            )
 
         try:
             category = category_registry.async_create(
@@ -216,6 +223,10 @@ class CategoryDetailView(HomeAssistantView):
     name = "api:config_mcp:category"
     requires_auth = True
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with the category registry."""
+        self._category_registry = cr.async_get(hass)
+
     async def get(
         self, request: web.Request, scope: str, category_id: str
     ) -> web.Response:
@@ -246,7 +257,7 @@ class CategoryDetailView(HomeAssistantView):
                 ERR_CATEGORY_INVALID_SCOPE,
             )
 
-        category_registry = cr.async_get(hass)
+        category_registry = self._category_registry
         category = category_registry.async_get_category(scope=scope, category_id=category_id)
 
         if category is None:
@@ -310,7 +321,7 @@ class CategoryDetailView(HomeAssistantView):
             )
 
         try:
-            body = await request.json()
+            body = await request.json(loads=json_loads)
         except ValueError:
             return self.json_message(
                 "Invalid JSON in request body",
@@ -318,7 +329,7 @@ class CategoryDetailView(HomeAssistantView):
                 ERR_INVALID_CONFIG,
             )
 
-        category_registry = cr.async_get(hass)
+        category_registry = self._category_registry
         category = category_registry.async_get_category(scope=scope, category_id=category_id)
 
         if category is None:
@@ -397,7 +408,7 @@ class CategoryDetailView(HomeAssistantView):
                 ERR_CATEGORY_INVALID_SCOPE,
             )
 
-        category_registry = cr.async_get(hass)
+        category_registry = self._category_registry
         category = category_registry.async_get_category(scope=scope, category_id=category_id)
 
         if category is None:
@@ -430,6 +441,10 @@ class LabelListView(HomeAssistantView):
     name = "api:config_mcp:labels"
     requires_auth = True
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with the label registry."""
+        self._label_registry = lr.async_get(hass)
+
     async def get(self, request: web.Request) -> web.Response:
         """Handle GET request - list all labels.
 
@@ -445,7 +460,7 @@ class LabelListView(HomeAssistantView):
                 HTTPStatus.FORBIDDEN,
             )
 
-        label_registry = lr.async_get(hass)
+        label_registry = self._label_registry
 
         labels = []
         for label in label_registry.async_list_labels():
@@ -496,7 +511,7 @@ class LabelListView(HomeAssistantView):
             )
 
         try:
-            body = await request.json()
+            body = await request.json(loads=json_loads)
         except ValueError:
             return self.json_message(
                 "Invalid JSON in request body",
@@ -516,16 +531,19 @@ class LabelListView(HomeAssistantView):
         color = body.get("color")
         description = body.get("description")
 
-        label_registry = lr.async_get(hass)
+        label_registry = self._label_registry
 
         # Check if name already exists
-        for existing in label_registry.async_list_labels():
-            if existing.name.lower() == name.lower():
-                return self.json_message(
-                    f"Label with name '{name}' already exists",
-                    HTTPStatus.CONFLICT,
-                    ERR_LABEL_EXISTS,
-                )
+        target = name.casefold()
+        if any(
+            existing.name.casefold() == target
+            for existing in label_registry.async_list_labels()
+        ):
+            return self.json_message(
+                f"Label with name '{name}' already exists",
+                HTTPStatus.CONFLICT,
+                ERR_LABEL_EXISTS,
+            )
 
         try:
             label = label_registry.async_create(
@@ -561,6 +579,10 @@ class LabelDetailView(HomeAssistantView):
     name = "api:config_mcp:label"
     requires_auth = True
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with the label registry."""
+        self._label_registry = lr.async_get(hass)
+
     async def get(self, request: web.Request, label_id: str) -> web.Response:
         """Handle GET request - get single label.
 
@@ -580,7 +602,7 @@ class LabelDetailView(HomeAssistantView):
                 HTTPStatus.FORBIDDEN,
             )
 
-        label_registry = lr.async_get(hass)
+        label_registry = self._label_registry
         label = label_registry.async_get_label(label_id)
 
         if label is None:
@@ -637,7 +659,7 @@ class LabelDetailView(HomeAssistantView):
             )
 
         try:
-            body = await request.json()
+            body = await request.json(loads=json_loads)
         except ValueError:
             return self.json_message(
                 "Invalid JSON in request body",
@@ -645,7 +667,7 @@ class LabelDetailView(HomeAssistantView):
                 ERR_INVALID_CONFIG,
             )
 
-        label_registry = lr.async_get(hass)
+        label_registry = self._label_registry
         label = label_registry.async_get_label(label_id)
 
         if label is None:
@@ -718,7 +740,7 @@ class LabelDetailView(HomeAssistantView):
                 HTTPStatus.UNAUTHORIZED,
             )
 
-        label_registry = lr.async_get(hass)
+        label_registry = self._label_registry
         label = label_registry.async_get_label(label_id)
 
         if label is None:
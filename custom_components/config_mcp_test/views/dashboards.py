@@ -1,16 +1,33 @@
-"""HTTP views for dashboard REST API."""
+"""HTTP views for dashboard REST API.
+
+Handlers here make no outbound HTTP calls. If one ever needs to, use the shared
+session from homeassistant.helpers.aiohttp_client.async_get_clientsession rather
+than constructing an aiohttp.ClientSession per request.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
 import voluptuous as vol
 
+from homeassistant.components.frontend import (
+    DATA_PANELS,
+    async_register_built_in_panel,
+    async_remove_panel,
+)
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.core import HomeAssistant
+from homeassistant.components.lovelace.dashboard import LovelaceStorage
+from homeassistant.const import CONTENT_TYPE_JSON
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
 
 from ..const import (
     API_BASE_PATH_DASHBOARDS,
@@ -25,14 +42,20 @@ from ..const import (
     CONF_TITLE,
     CONF_URL_PATH,
     DATA_DASHBOARDS_COLLECTION,
-    DEFAULT_OPTIONS,
-    DOMAIN,
+    DATA_DASHBOARDS_COLLECTION_LOADED,
+    DATA_DASHBOARDS_CONFIG_CACHE,
+    DATA_DASHBOARDS_INFO_CACHE,
+    DATA_DASHBOARDS_LIST_CACHE,
+    DATA_DASHBOARDS_LIST_GENERATION,
+    DATA_DASHBOARDS_LOAD_LOCK,
+    DATA_DASHBOARDS_URL_INDEX,
     ERR_DASHBOARD_EXISTS,
     ERR_DASHBOARD_NOT_FOUND,
     ERR_INVALID_CONFIG,
     ERR_INVALID_ENTITIES,
     ERR_YAML_DASHBOARD,
     LOVELACE_DATA,
+    MAX_DASHBOARD_BODY_SIZE,
     MODE_STORAGE,
     MODE_YAML,
     VALIDATE_NONE,
@@ -46,49 +69,26 @@ from ..validation import (
     validate_patch_data,
     validate_update_data,
 )
+from .helpers import etag_response, get_config_options, payload_etag, require
 
 if TYPE_CHECKING:
     from homeassistant.components.lovelace import LovelaceData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Dashboard metadata fields that PUT/PATCH may change
+_UPDATE_FIELDS = frozenset(
+    {CONF_TITLE, CONF_ICON, CONF_SHOW_IN_SIDEBAR, CONF_REQUIRE_ADMIN}
+)
 
-def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
-    """Get the current configuration options for config_mcp.
-
-    Args:
-        hass: Home Assistant instance
-
-    Returns:
-        Configuration options dict, merged with defaults
-    """
-    options = DEFAULT_OPTIONS.copy()
-
-    # Get options from config entry
-    if DOMAIN in hass.data:
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            # entry_data is the config entry data, we need the options
-            # Find the config entry by entry_id
-            for entry in hass.config_entries.async_entries(DOMAIN):
-                if entry.entry_id == entry_id:
-                    options.update(entry.options)
-                    break
-
-    return options
-
+# Seconds a cached dashboard list is served before it is refreshed in the background
+DASHBOARD_LIST_CACHE_TTL = 5
 
-def check_permission(hass: HomeAssistant, permission: str) -> bool:
-    """Check if a specific permission is enabled.
+# Seconds a dashboard's async_get_info() result is reused
+DASHBOARD_INFO_CACHE_TTL = 5
 
-    Args:
-        hass: Home Assistant instance
-        permission: The permission key to check
-
-    Returns:
-        True if permitted, False otherwise
-    """
-    options = get_config_options(hass)
-    return options.get(permission, False)
+# Dashboard configs larger than this (in bytes) are checked for missing entities in the executor
+EXECUTOR_VALIDATION_THRESHOLD = 16 * 1024
 
 
 def get_lovelace_data(hass: HomeAssistant):
@@ -98,8 +98,6 @@ def get_lovelace_data(hass: HomeAssistant):
 
 def get_dashboards_collection(hass: HomeAssistant):
     """Get the dashboards collection for storage dashboards."""
-    from ..const import DOMAIN
-
     # First try our component's stored collection
     collection = hass.data.get(DATA_DASHBOARDS_COLLECTION)
     if collection is not None:
@@ -112,17 +110,22 @@ def get_dashboards_collection(hass: HomeAssistant):
     return None
 
 
-async def _register_dashboard_with_lovelace(
+def _discard_cached(hass: HomeAssistant, key: str, url_path: str | None) -> None:
+    """Drop url_path from a per-dashboard map in hass.data, if the map exists."""
+    if (cache := hass.data.get(key)) is not None:
+        cache.pop(url_path, None)
+
+
+@callback
+def _register_dashboard_with_lovelace(
     hass: HomeAssistant, url_path: str, data: dict[str, Any]
 ) -> None:
     """Register a newly created dashboard with lovelace and frontend.
 
     This makes the dashboard immediately visible without requiring a restart.
+    Nothing here does I/O, so it runs inline instead of as a coroutine.
     """
     try:
-        from homeassistant.components.lovelace.dashboard import LovelaceStorage
-        from homeassistant.components.frontend import async_register_built_in_panel
-
         lovelace_data = get_lovelace_data(hass)
         if lovelace_data is None:
             _LOGGER.warning("Cannot register dashboard - lovelace data not available")
@@ -140,6 +143,7 @@ async def _register_dashboard_with_lovelace(
 
         # Add to lovelace dashboards
         lovelace_data.dashboards[url_path] = LovelaceStorage(hass, config)
+        _discard_cached(hass, DATA_DASHBOARDS_CONFIG_CACHE, url_path)
 
         # Register frontend panel using proper import
         async_register_built_in_panel(
@@ -161,16 +165,16 @@ async def _register_dashboard_with_lovelace(
         )
 
 
-async def _unregister_dashboard_from_lovelace(
+@callback
+def _unregister_dashboard_from_lovelace(
     hass: HomeAssistant, url_path: str
 ) -> None:
     """Unregister a dashboard from lovelace and frontend."""
     try:
-        from homeassistant.components.frontend import async_remove_panel
-
         lovelace_data = get_lovelace_data(hass)
         if lovelace_data and url_path in lovelace_data.dashboards:
             del lovelace_data.dashboards[url_path]
+        _discard_cached(hass, DATA_DASHBOARDS_CONFIG_CACHE, url_path)
 
         # Remove frontend panel
         async_remove_panel(hass, url_path)
@@ -184,13 +188,77 @@ async def _unregister_dashboard_from_lovelace(
 
 
 async def _ensure_collection_loaded(hass: HomeAssistant):
-    """Ensure the dashboards collection is loaded with latest data."""
+    """Ensure the dashboards collection is loaded with latest data.
+
+    The collection is only reloaded from storage after it has been marked
+    stale, either by a dashboard change made outside these views or by a
+    failed mutation. Concurrent callers share a single reload.
+    """
     collection = hass.data.get(DATA_DASHBOARDS_COLLECTION)
-    if collection is not None:
-        await collection.async_load()
+    if collection is None or hass.data.get(DATA_DASHBOARDS_COLLECTION_LOADED):
+        return collection
+
+    lock: asyncio.Lock = hass.data.setdefault(DATA_DASHBOARDS_LOAD_LOCK, asyncio.Lock())
+    async with lock:
+        # Another request may have reloaded while this one waited
+        if not hass.data.get(DATA_DASHBOARDS_COLLECTION_LOADED):
+            await collection.async_load()
+            hass.data[DATA_DASHBOARDS_COLLECTION_LOADED] = True
     return collection
 
 
+def _invalidate_collection(hass: HomeAssistant) -> None:
+    """Force the next mutation to reload the dashboards collection."""
+    hass.data.pop(DATA_DASHBOARDS_COLLECTION_LOADED, None)
+
+
+@lru_cache(maxsize=256)
+def _invalid_config_body(message: str) -> bytes:
+    """Encode a 400 invalid-configuration body, reusing recent encodings."""
+    return json_bytes(
+        {"message": f"Invalid configuration: {message}", "code": ERR_INVALID_CONFIG}
+    )
+
+
+def _invalid_config_response(err: vol.Invalid) -> web.Response:
+    """Return the 400 response for a voluptuous validation error."""
+    return web.Response(
+        body=_invalid_config_body(str(err)),
+        status=HTTPStatus.BAD_REQUEST,
+        content_type=CONTENT_TYPE_JSON,
+    )
+
+
+def _resolve_dashboard(
+    view: HomeAssistantView, lovelace_data: LovelaceData | None, dashboard_id: str
+) -> tuple[str | None, Any, web.Response | None]:
+    """Resolve a dashboard ID from the URL to its lovelace config.
+
+    "lovelace" refers to the default dashboard, whose url_path is None.
+
+    Returns:
+        (url_path, config, None) if found, or (None, None, 404 response)
+    """
+    url_path = None if dashboard_id == "lovelace" else dashboard_id
+    config = lovelace_data.dashboards.get(url_path) if lovelace_data else None
+    if config is None:
+        return None, None, view.json_message(
+            f"Dashboard '{dashboard_id}' not found",
+            HTTPStatus.NOT_FOUND,
+            ERR_DASHBOARD_NOT_FOUND,
+        )
+    return url_path, config, None
+
+
+def _is_yaml_dashboard(config) -> bool:
+    """Return whether a lovelace dashboard config is YAML-based (read-only).
+
+    Uses the config's mode attribute rather than async_get_info(), which
+    loads the dashboard config from storage or disk just to report it.
+    """
+    return config.mode == MODE_YAML
+
+
 def _url_path_to_item_id(url_path: str) -> str:
     """Convert url_path to collection item ID.
 
@@ -199,16 +267,196 @@ def _url_path_to_item_id(url_path: str) -> str:
     return url_path.replace("-", "_")
 
 
-def _find_item_id_by_url_path(collection, url_path: str) -> str | None:
+def _find_item_id_by_url_path(
+    hass: HomeAssistant, collection, url_path: str
+) -> str | None:
     """Find the collection item ID for a given url_path.
 
+    Lookups go through a url_path -> item ID index kept in hass.data. The
+    index is rebuilt from the collection whenever an entry is missing or no
+    longer matches, so changes made outside these views are still picked up.
+
     Returns the item ID if found, None otherwise.
     """
-    for item_id, item in collection.data.items():
-        if item.get("url_path") == url_path:
+    index: dict[str, str] | None = hass.data.get(DATA_DASHBOARDS_URL_INDEX)
+    if index is not None:
+        item_id = index.get(url_path)
+        if (
+            item_id is not None
+            and (item := collection.data.get(item_id)) is not None
+            and item.get("url_path") == url_path
+        ):
             return item_id
+
+    index = {
+        item["url_path"]: item_id
+        for item_id, item in collection.data.items()
+        if "url_path" in item
+    }
+    hass.data[DATA_DASHBOARDS_URL_INDEX] = index
     # Fallback: try the sanitized version
-    return _url_path_to_item_id(url_path)
+    return index.get(url_path) or _url_path_to_item_id(url_path)
+
+
+def _find_url_path_conflict(
+    hass: HomeAssistant, lovelace_data: LovelaceData | None, url_path: str
+) -> str | None:
+    """Return why a new dashboard cannot use url_path, or None if it is free."""
+    # Check if dashboard already exists
+    if lovelace_data and url_path in lovelace_data.dashboards:
+        return f"Dashboard '{url_path}' already exists"
+
+    # Check if URL path conflicts with existing panels
+    panels = hass.data.get(DATA_PANELS)
+    if panels and url_path in panels:
+        return f"URL path '{url_path}' conflicts with existing panel"
+
+    return None
+
+
+async def _async_create_dashboard(
+    hass: HomeAssistant, collection, validated_data: dict[str, Any]
+) -> dict[str, Any]:
+    """Create a storage dashboard in the collection.
+
+    Storage writes from the collection are debounced, so creating several
+    dashboards back to back results in a single save.
+
+    Returns:
+        The created dashboard metadata
+    """
+    url_path = validated_data[CONF_URL_PATH]
+    item = await collection.async_create_item(validated_data)
+    _invalidate_dashboard_caches(hass)
+    index = hass.data.get(DATA_DASHBOARDS_URL_INDEX)
+    if index is not None:
+        index[url_path] = item["id"]
+
+    return {
+        "id": url_path,
+        "url_path": url_path,
+        "title": validated_data[CONF_TITLE],
+        "icon": validated_data.get(CONF_ICON, "mdi:view-dashboard"),
+        "show_in_sidebar": validated_data.get(CONF_SHOW_IN_SIDEBAR, True),
+        "require_admin": validated_data.get(CONF_REQUIRE_ADMIN, False),
+        "mode": MODE_STORAGE,
+    }
+
+
+def _dashboard_metadata(
+    dashboard_id: str, url_path: str | None, info: dict[str, Any]
+) -> dict[str, Any]:
+    """Build the metadata returned for a dashboard from its info or item data."""
+    return {
+        "id": dashboard_id,
+        "url_path": url_path,
+        "mode": info.get("mode", MODE_STORAGE),
+        "title": info.get("title"),
+        "icon": info.get("icon"),
+        "show_in_sidebar": info.get("show_in_sidebar", True),
+        "require_admin": info.get("require_admin", False),
+    }
+
+
+@dataclass
+class _DashboardListCache:
+    """Serialized dashboard list together with its ETag."""
+
+    payload: bytes
+    etag: str
+    timestamp: float
+    refreshing: bool = False
+
+
+async def _async_get_dashboard_info(
+    hass: HomeAssistant, url_path: str | None, config
+) -> dict[str, Any]:
+    """Return a dashboard's async_get_info(), reusing recent results.
+
+    Entries are dropped when a dashboard changes (see
+    _invalidate_dashboard_caches and the lovelace_updated listener); the
+    TTL bounds staleness for YAML dashboards edited on disk.
+    """
+    cache: dict[str | None, tuple[float, dict[str, Any]]] = hass.data.setdefault(
+        DATA_DASHBOARDS_INFO_CACHE, {}
+    )
+    now = time.monotonic()
+    if (cached := cache.get(url_path)) is not None and cached[0] > now:
+        return cached[1]
+
+    info = await config.async_get_info()
+    cache[url_path] = (now + DASHBOARD_INFO_CACHE_TTL, info)
+    return info
+
+
+async def _async_build_dashboard_list(
+    hass: HomeAssistant, lovelace_data: LovelaceData
+) -> _DashboardListCache:
+    """Collect metadata for all dashboards and serialize it for caching."""
+    # YAML dashboards load their config from disk, so fetch all infos concurrently
+    dashboard_configs = lovelace_data.dashboards
+    url_paths = list(dashboard_configs)
+    infos = await asyncio.gather(
+        *(
+            _async_get_dashboard_info(hass, url_path, dashboard_configs[url_path])
+            for url_path in url_paths
+        ),
+        return_exceptions=True,
+    )
+
+    dashboards = []
+
+    for url_path, info in zip(url_paths, infos):
+        # return_exceptions also hands back CancelledError, a BaseException
+        if isinstance(info, BaseException):
+            _LOGGER.warning(
+                "Error getting info for dashboard %s: %s",
+                url_path,
+                info,
+            )
+            continue
+        dashboards.append(
+            _dashboard_metadata(url_path or "lovelace", url_path, info)
+        )
+
+    payload = json_bytes(dashboards)
+    return _DashboardListCache(
+        payload,
+        payload_etag(payload),
+        time.monotonic(),
+    )
+
+
+async def _async_refresh_dashboard_list(
+    hass: HomeAssistant, lovelace_data: LovelaceData, stale: _DashboardListCache
+) -> None:
+    """Rebuild a stale dashboard list cache in the background."""
+    try:
+        fresh = await _async_build_dashboard_list(hass, lovelace_data)
+    finally:
+        stale.refreshing = False
+    # A mutation may have invalidated the cache while this was running
+    if hass.data.get(DATA_DASHBOARDS_LIST_CACHE) is stale:
+        hass.data[DATA_DASHBOARDS_LIST_CACHE] = fresh
+
+
+@callback
+def invalidate_dashboard_list(hass: HomeAssistant) -> None:
+    """Drop the cached dashboard list.
+
+    Bumps a generation counter too, so a list that was being built while
+    this ran is not stored afterwards.
+    """
+    hass.data.pop(DATA_DASHBOARDS_LIST_CACHE, None)
+    hass.data[DATA_DASHBOARDS_LIST_GENERATION] = (
+        hass.data.get(DATA_DASHBOARDS_LIST_GENERATION, 0) + 1
+    )
+
+
+def _invalidate_dashboard_caches(hass: HomeAssistant) -> None:
+    """Drop the cached dashboard list and infos after a dashboard change."""
+    invalidate_dashboard_list(hass)
+    hass.data.pop(DATA_DASHBOARDS_INFO_CACHE, None)
 
 
 class DashboardListView(HomeAssistantView):
@@ -218,6 +466,11 @@ class DashboardListView(HomeAssistantView):
     name = "api:config_mcp:dashboards"
     requires_auth = True
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with the lovelace data."""
+        self._lovelace_data: LovelaceData | None = get_lovelace_data(hass)
+
+    @require(CONF_DASHBOARDS_READ, "Dashboard read permission is disabled")
     async def get(self, request: web.Request) -> web.Response:
         """Handle GET request - list all dashboards.
 
@@ -227,44 +480,41 @@ class DashboardListView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Check read permission
-        if not check_permission(hass, CONF_DASHBOARDS_READ):
-            return self.json_message(
-                "Dashboard read permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        lovelace_data = get_lovelace_data(hass)
+        lovelace_data = self._lovelace_data
 
         if not lovelace_data:
             return self.json([])
 
-        dashboards = []
-
-        for url_path, config in lovelace_data.dashboards.items():
-            try:
-                info = await config.async_get_info()
-                dashboard_data = {
-                    "id": url_path if url_path else "lovelace",
-                    "url_path": url_path,
-                    "mode": info.get("mode", MODE_STORAGE),
-                    "title": info.get("title"),
-                    "icon": info.get("icon"),
-                    "show_in_sidebar": info.get("show_in_sidebar", True),
-                    "require_admin": info.get("require_admin", False),
-                }
-                dashboards.append(dashboard_data)
-            except Exception as err:
-                _LOGGER.warning(
-                    "Error getting info for dashboard %s: %s",
-                    url_path,
-                    err,
-                )
-                continue
-
-        return self.json(dashboards)
+        cached: _DashboardListCache | None = hass.data.get(DATA_DASHBOARDS_LIST_CACHE)
+        if cached is None:
+            generation = hass.data.get(DATA_DASHBOARDS_LIST_GENERATION, 0)
+            cached = await _async_build_dashboard_list(hass, lovelace_data)
+            # Don't let a list built before a dashboard change outlive it
+            if hass.data.get(DATA_DASHBOARDS_LIST_GENERATION, 0) == generation:
+                hass.data[DATA_DASHBOARDS_LIST_CACHE] = cached
+        elif (
+            not cached.refreshing
+            and time.monotonic() - cached.timestamp > DASHBOARD_LIST_CACHE_TTL
+        ):
+            # Serve the stale list now and refresh it for the next caller
+            cached.refreshing = True
+            hass.async_create_background_task(
+                _async_refresh_dashboard_list(hass, lovelace_data, cached),
+                "config_mcp dashboard list refresh",
+            )
 
-    async def post(self, request: web.Request) -> web.Response:
+        return etag_response(request, cached.payload, cached.etag)
+
+    @require(
+        CONF_DASHBOARDS_CREATE,
+        "Dashboard create permission is disabled",
+        admin=True,
+        json_body=True,
+        max_body_size=MAX_DASHBOARD_BODY_SIZE,
+    )
+    async def post(
+        self, request: web.Request, body: dict[str, Any]
+    ) -> web.Response:
         """Handle POST request - create new dashboard.
 
         Request body:
@@ -285,56 +535,18 @@ class DashboardListView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Check create permission
-        if not check_permission(hass, CONF_DASHBOARDS_CREATE):
-            return self.json_message(
-                "Dashboard create permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        # Check admin permission
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
-        try:
-            body = await request.json()
-        except ValueError:
-            return self.json_message(
-                "Invalid JSON in request body",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
-
         # Validate request data
         try:
             validated_data = validate_create_data(body)
         except vol.Invalid as err:
-            return self.json_message(
-                f"Invalid configuration: {err}",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
+            return _invalid_config_response(err)
 
         url_path = validated_data[CONF_URL_PATH]
-        lovelace_data = get_lovelace_data(hass)
-        dashboard_configs = lovelace_data.dashboards
-
-        # Check if dashboard already exists
-        if url_path in dashboard_configs:
-            return self.json_message(
-                f"Dashboard '{url_path}' already exists",
-                HTTPStatus.CONFLICT,
-                ERR_DASHBOARD_EXISTS,
-            )
 
-        # Check if URL path conflicts with existing panels
-        if url_path in hass.data.get("frontend_panels", {}):
+        conflict = _find_url_path_conflict(hass, self._lovelace_data, url_path)
+        if conflict is not None:
             return self.json_message(
-                f"URL path '{url_path}' conflicts with existing panel",
+                conflict,
                 HTTPStatus.CONFLICT,
                 ERR_DASHBOARD_EXISTS,
             )
@@ -348,31 +560,124 @@ class DashboardListView(HomeAssistantView):
                     HTTPStatus.INTERNAL_SERVER_ERROR,
                 )
 
-            await collection.async_create_item(validated_data)
+            result = await _async_create_dashboard(hass, collection, validated_data)
 
             # Also register the dashboard with lovelace and frontend for immediate visibility
-            await _register_dashboard_with_lovelace(hass, url_path, validated_data)
+            _register_dashboard_with_lovelace(hass, url_path, validated_data)
 
-            return self.json(
-                {
-                    "id": url_path,
-                    "url_path": url_path,
-                    "title": validated_data[CONF_TITLE],
-                    "icon": validated_data.get(CONF_ICON, "mdi:view-dashboard"),
-                    "show_in_sidebar": validated_data.get(CONF_SHOW_IN_SIDEBAR, True),
-                    "require_admin": validated_data.get(CONF_REQUIRE_ADMIN, False),
-                    "mode": MODE_STORAGE,
-                },
-                HTTPStatus.CREATED,
-            )
+            return self.json(result, HTTPStatus.CREATED)
         except Exception as err:
-            _LOGGER.exception("Error creating dashboard: %s", err)
+            _invalidate_collection(hass)
+            _LOGGER.exception("Error creating dashboard")
             return self.json_message(
                 f"Error creating dashboard: {err}",
                 HTTPStatus.INTERNAL_SERVER_ERROR,
             )
 
 
+class DashboardBatchView(HomeAssistantView):
+    """View to create several dashboards in one request."""
+
+    url = API_BASE_PATH_DASHBOARDS + "/batch"
+    name = "api:config_mcp:dashboards:batch"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with the lovelace data."""
+        self._lovelace_data: LovelaceData | None = get_lovelace_data(hass)
+
+    @require(
+        CONF_DASHBOARDS_CREATE,
+        "Dashboard create permission is disabled",
+        admin=True,
+        json_body=True,
+        max_body_size=MAX_DASHBOARD_BODY_SIZE,
+    )
+    async def post(self, request: web.Request, body: Any) -> web.Response:
+        """Handle POST request - create multiple dashboards.
+
+        Request body:
+            [
+                {"url_path": "my-dashboard", "title": "My Dashboard"},
+                {"url_path": "other-dashboard", "title": "Other Dashboard"}
+            ]
+
+        Each entry accepts the same fields as POST /dashboards. Entries are
+        processed independently; one invalid entry does not stop the others.
+
+        Returns:
+            207: Per-entry results, each with its own "status"
+            400: Request body is not a list
+            401: Not authorized (non-admin)
+            403: Permission denied
+        """
+        hass: HomeAssistant = request.app["hass"]
+
+        if not isinstance(body, list):
+            return self.json_message(
+                "Request body must be a list of dashboards",
+                HTTPStatus.BAD_REQUEST,
+                ERR_INVALID_CONFIG,
+            )
+
+        collection = get_dashboards_collection(hass)
+        if collection is None:
+            return self.json_message(
+                "Dashboard collection not available. Ensure lovelace is in storage mode.",
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+            )
+
+        results: list[dict[str, Any]] = []
+        created: list[tuple[str, dict[str, Any]]] = []
+
+        for entry in body:
+            try:
+                validated_data = validate_create_data(entry)
+            except vol.Invalid as err:
+                results.append({
+                    "status": HTTPStatus.BAD_REQUEST,
+                    "message": f"Invalid configuration: {err}",
+                    "code": ERR_INVALID_CONFIG,
+                })
+                continue
+
+            # Dashboards created earlier in this batch are already in the
+            # collection but are only registered with lovelace further down
+            url_path = validated_data[CONF_URL_PATH]
+            conflict = _find_url_path_conflict(hass, self._lovelace_data, url_path)
+            if conflict is None and any(url_path == done for done, _ in created):
+                conflict = f"Dashboard '{url_path}' already exists"
+            if conflict is not None:
+                results.append({
+                    "status": HTTPStatus.CONFLICT,
+                    "url_path": url_path,
+                    "message": conflict,
+                    "code": ERR_DASHBOARD_EXISTS,
+                })
+                continue
+
+            try:
+                result = await _async_create_dashboard(hass, collection, validated_data)
+            except Exception as err:
+                _invalidate_collection(hass)
+                _LOGGER.exception("Error creating dashboard")
+                results.append({
+                    "status": HTTPStatus.INTERNAL_SERVER_ERROR,
+                    "url_path": url_path,
+                    "message": f"Error creating dashboard: {err}",
+                })
+                continue
+
+            created.append((url_path, validated_data))
+            results.append({"status": HTTPStatus.CREATED, **result})
+
+        # Register the new dashboards with lovelace and frontend for immediate visibility
+        for url_path, data in created:
+            _register_dashboard_with_lovelace(hass, url_path, data)
+
+        return self.json(results, HTTPStatus.MULTI_STATUS)
+
+
 class DashboardDetailView(HomeAssistantView):
     """View for single dashboard operations."""
 
@@ -380,6 +685,11 @@ class DashboardDetailView(HomeAssistantView):
     name = "api:config_mcp:dashboard"
     requires_auth = True
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with the lovelace data."""
+        self._lovelace_data: LovelaceData | None = get_lovelace_data(hass)
+
+    @require(CONF_DASHBOARDS_READ, "Dashboard read permission is disabled")
     async def get(
         self, request: web.Request, dashboard_id: str
     ) -> web.Response:
@@ -395,36 +705,14 @@ class DashboardDetailView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Check read permission
-        if not check_permission(hass, CONF_DASHBOARDS_READ):
-            return self.json_message(
-                "Dashboard read permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        lovelace_data = get_lovelace_data(hass)
-
-        if not lovelace_data:
-            return self.json_message(
-                f"Dashboard '{dashboard_id}' not found",
-                HTTPStatus.NOT_FOUND,
-                ERR_DASHBOARD_NOT_FOUND,
-            )
-
-        # Handle default dashboard
-        url_path = None if dashboard_id == "lovelace" else dashboard_id
-        dashboard_configs = lovelace_data.dashboards
-
-        config = dashboard_configs.get(url_path)
-        if config is None:
-            return self.json_message(
-                f"Dashboard '{dashboard_id}' not found",
-                HTTPStatus.NOT_FOUND,
-                ERR_DASHBOARD_NOT_FOUND,
-            )
+        url_path, config, error = _resolve_dashboard(
+            self, self._lovelace_data, dashboard_id
+        )
+        if error is not None:
+            return error
 
         try:
-            info = await config.async_get_info()
+            info = await _async_get_dashboard_info(hass, url_path, config)
         except Exception as err:
             _LOGGER.error("Error getting dashboard info: %s", err)
             return self.json_message(
@@ -432,20 +720,19 @@ class DashboardDetailView(HomeAssistantView):
                 HTTPStatus.INTERNAL_SERVER_ERROR,
             )
 
-        result = {
-            "id": dashboard_id,
-            "url_path": url_path,
-            "mode": info.get("mode", MODE_STORAGE),
-            "title": info.get("title"),
-            "icon": info.get("icon"),
-            "show_in_sidebar": info.get("show_in_sidebar", True),
-            "require_admin": info.get("require_admin", False),
-        }
+        result = _dashboard_metadata(dashboard_id, url_path, info)
 
-        return self.json(result)
+        return etag_response(request, json_bytes(result))
 
+    @require(
+        CONF_DASHBOARDS_UPDATE,
+        "Dashboard update permission is disabled",
+        admin=True,
+        json_body=True,
+        max_body_size=MAX_DASHBOARD_BODY_SIZE,
+    )
     async def put(
-        self, request: web.Request, dashboard_id: str
+        self, request: web.Request, body: dict[str, Any], dashboard_id: str
     ) -> web.Response:
         """Handle PUT request - full update of dashboard metadata.
 
@@ -470,59 +757,24 @@ class DashboardDetailView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Check update permission
-        if not check_permission(hass, CONF_DASHBOARDS_UPDATE):
-            return self.json_message(
-                "Dashboard update permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        # Check admin permission
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
-        lovelace_data = get_lovelace_data(hass)
-        url_path = None if dashboard_id == "lovelace" else dashboard_id
-        dashboard_configs = lovelace_data.dashboards
-
-        config = dashboard_configs.get(url_path)
-        if config is None:
-            return self.json_message(
-                f"Dashboard '{dashboard_id}' not found",
-                HTTPStatus.NOT_FOUND,
-                ERR_DASHBOARD_NOT_FOUND,
-            )
+        url_path, config, error = _resolve_dashboard(
+            self, self._lovelace_data, dashboard_id
+        )
+        if error is not None:
+            return error
 
         # Check if YAML dashboard (read-only)
-        info = await config.async_get_info()
-        if info.get("mode") == MODE_YAML:
+        if _is_yaml_dashboard(config):
             return self.json_message(
                 f"Dashboard '{dashboard_id}' is YAML-based and read-only",
                 HTTPStatus.CONFLICT,
                 ERR_YAML_DASHBOARD,
             )
 
-        try:
-            body = await request.json()
-        except ValueError:
-            return self.json_message(
-                "Invalid JSON in request body",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
-
         try:
             validated_data = validate_update_data(body)
         except vol.Invalid as err:
-            return self.json_message(
-                f"Invalid configuration: {err}",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
+            return _invalid_config_response(err)
 
         try:
             # Reload collection to ensure we have latest data
@@ -534,8 +786,9 @@ class DashboardDetailView(HomeAssistantView):
                 )
 
             # Find the correct item ID (may differ from url_path due to sanitization)
-            item_id = _find_item_id_by_url_path(collection, url_path)
+            item_id = _find_item_id_by_url_path(hass, collection, url_path)
             await collection.async_update_item(item_id, validated_data)
+            _invalidate_dashboard_caches(hass)
 
             return self.json({
                 "id": dashboard_id,
@@ -544,14 +797,22 @@ class DashboardDetailView(HomeAssistantView):
                 **validated_data,
             })
         except Exception as err:
-            _LOGGER.exception("Error updating dashboard: %s", err)
+            _invalidate_collection(hass)
+            _LOGGER.exception("Error updating dashboard")
             return self.json_message(
                 f"Error updating dashboard: {err}",
                 HTTPStatus.INTERNAL_SERVER_ERROR,
             )
 
+    @require(
+        CONF_DASHBOARDS_UPDATE,
+        "Dashboard update permission is disabled",
+        admin=True,
+        json_body=True,
+        max_body_size=MAX_DASHBOARD_BODY_SIZE,
+    )
     async def patch(
-        self, request: web.Request, dashboard_id: str
+        self, request: web.Request, body: dict[str, Any], dashboard_id: str
     ) -> web.Response:
         """Handle PATCH request - partial update of dashboard metadata.
 
@@ -576,51 +837,20 @@ class DashboardDetailView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Check update permission
-        if not check_permission(hass, CONF_DASHBOARDS_UPDATE):
-            return self.json_message(
-                "Dashboard update permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        # Check admin permission
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
-        lovelace_data = get_lovelace_data(hass)
-        url_path = None if dashboard_id == "lovelace" else dashboard_id
-        dashboard_configs = lovelace_data.dashboards
-
-        config = dashboard_configs.get(url_path)
-        if config is None:
-            return self.json_message(
-                f"Dashboard '{dashboard_id}' not found",
-                HTTPStatus.NOT_FOUND,
-                ERR_DASHBOARD_NOT_FOUND,
-            )
+        url_path, config, error = _resolve_dashboard(
+            self, self._lovelace_data, dashboard_id
+        )
+        if error is not None:
+            return error
 
         # Check if YAML dashboard (read-only)
-        info = await config.async_get_info()
-        if info.get("mode") == MODE_YAML:
+        if _is_yaml_dashboard(config):
             return self.json_message(
                 f"Dashboard '{dashboard_id}' is YAML-based and read-only",
                 HTTPStatus.CONFLICT,
                 ERR_YAML_DASHBOARD,
             )
 
-        try:
-            body = await request.json()
-        except ValueError:
-            return self.json_message(
-                "Invalid JSON in request body",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
-
         if not body:
             return self.json_message(
                 "Request body cannot be empty",
@@ -631,11 +861,7 @@ class DashboardDetailView(HomeAssistantView):
         try:
             validated_data = validate_patch_data(body)
         except vol.Invalid as err:
-            return self.json_message(
-                f"Invalid configuration: {err}",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
+            return _invalid_config_response(err)
 
         try:
             # Reload collection to ensure we have latest data
@@ -647,41 +873,46 @@ class DashboardDetailView(HomeAssistantView):
                 )
 
             # Find the correct item ID (may differ from url_path due to sanitization)
-            item_id = _find_item_id_by_url_path(collection, url_path)
+            item_id = _find_item_id_by_url_path(hass, collection, url_path)
 
             # Get existing item data and merge with updates
-            existing_item = collection.data.get(item_id, {})
+            existing_item = collection.data.get(item_id)
+            if existing_item is None:
+                return self.json_message(
+                    f"Dashboard '{dashboard_id}' not found",
+                    HTTPStatus.NOT_FOUND,
+                    ERR_DASHBOARD_NOT_FOUND,
+                )
 
             # Only include fields that are allowed in updates (not id, url_path, mode)
-            allowed_fields = ["title", "icon", "show_in_sidebar", "require_admin"]
-            merged_data = {}
-            for field in allowed_fields:
-                if field in validated_data:
-                    merged_data[field] = validated_data[field]
-                elif field in existing_item:
-                    merged_data[field] = existing_item[field]
+            merged_data = {
+                field: value
+                for field, value in {**existing_item, **validated_data}.items()
+                if field in _UPDATE_FIELDS
+            }
 
             _LOGGER.debug("PATCH: item_id=%s, merged_data=%s", item_id, merged_data)
 
             await collection.async_update_item(item_id, merged_data)
+            _invalidate_dashboard_caches(hass)
 
             # Return the merged data since lovelace object may not reflect changes immediately
-            return self.json({
-                "id": dashboard_id,
-                "url_path": url_path,
-                "mode": MODE_STORAGE,
-                "title": merged_data.get("title"),
-                "icon": merged_data.get("icon"),
-                "show_in_sidebar": merged_data.get("show_in_sidebar", True),
-                "require_admin": merged_data.get("require_admin", False),
-            })
+            return self.json(
+                _dashboard_metadata(dashboard_id, url_path, merged_data)
+            )
         except Exception as err:
-            _LOGGER.exception("Error updating dashboard: %s", err)
+            _invalidate_collection(hass)
+            _LOGGER.exception("Error updating dashboard")
             return self.json_message(
                 f"Error updating dashboard: {err}",
                 HTTPStatus.INTERNAL_SERVER_ERROR,
             )
 
+    @require(
+        CONF_DASHBOARDS_DELETE,
+        "Dashboard delete permission is disabled",
+        admin=True,
+    )
     async def delete(
         self, request: web.Request, dashboard_id: str
     ) -> web.Response:
@@ -699,21 +930,6 @@ class DashboardDetailView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Check delete permission
-        if not check_permission(hass, CONF_DASHBOARDS_DELETE):
-            return self.json_message(
-                "Dashboard delete permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        # Check admin permission
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
         # Cannot delete default dashboard
         if dashboard_id == "lovelace":
             return self.json_message(
@@ -722,21 +938,14 @@ class DashboardDetailView(HomeAssistantView):
                 "default_dashboard_protected",
             )
 
-        lovelace_data = get_lovelace_data(hass)
-        url_path = dashboard_id
-        dashboard_configs = lovelace_data.dashboards
-
-        config = dashboard_configs.get(url_path)
-        if config is None:
-            return self.json_message(
-                f"Dashboard '{dashboard_id}' not found",
-                HTTPStatus.NOT_FOUND,
-                ERR_DASHBOARD_NOT_FOUND,
-            )
+        url_path, config, error = _resolve_dashboard(
+            self, self._lovelace_data, dashboard_id
+        )
+        if error is not None:
+            return error
 
         # Check if YAML dashboard (cannot delete via API)
-        info = await config.async_get_info()
-        if info.get("mode") == MODE_YAML:
+        if _is_yaml_dashboard(config):
             return self.json_message(
                 f"Dashboard '{dashboard_id}' is YAML-based and cannot be deleted via API",
                 HTTPStatus.CONFLICT,
@@ -753,15 +962,18 @@ class DashboardDetailView(HomeAssistantView):
                 )
 
             # Find the correct item ID (may differ from url_path due to sanitization)
-            item_id = _find_item_id_by_url_path(collection, url_path)
+            item_id = _find_item_id_by_url_path(hass, collection, url_path)
             await collection.async_delete_item(item_id)
+            _invalidate_dashboard_caches(hass)
+            _discard_cached(hass, DATA_DASHBOARDS_URL_INDEX, url_path)
 
             # Also unregister from lovelace and frontend for immediate effect
-            await _unregister_dashboard_from_lovelace(hass, url_path)
+            _unregister_dashboard_from_lovelace(hass, url_path)
 
             return web.Response(status=HTTPStatus.NO_CONTENT)
         except Exception as err:
-            _LOGGER.exception("Error deleting dashboard: %s", err)
+            _invalidate_collection(hass)
+            _LOGGER.exception("Error deleting dashboard")
             return self.json_message(
                 f"Error deleting dashboard: {err}",
                 HTTPStatus.INTERNAL_SERVER_ERROR,
@@ -775,6 +987,11 @@ class DashboardConfigView(HomeAssistantView):
     name = "api:config_mcp:dashboard:config"
     requires_auth = True
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with the lovelace data."""
+        self._lovelace_data: LovelaceData | None = get_lovelace_data(hass)
+
+    @require(CONF_DASHBOARDS_READ, "Dashboard read permission is disabled")
     async def get(
         self, request: web.Request, dashboard_id: str
     ) -> web.Response:
@@ -790,36 +1007,23 @@ class DashboardConfigView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Check read permission
-        if not check_permission(hass, CONF_DASHBOARDS_READ):
-            return self.json_message(
-                "Dashboard read permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        lovelace_data = get_lovelace_data(hass)
-
-        if not lovelace_data:
-            return self.json_message(
-                f"Dashboard '{dashboard_id}' not found",
-                HTTPStatus.NOT_FOUND,
-                ERR_DASHBOARD_NOT_FOUND,
-            )
-
-        url_path = None if dashboard_id == "lovelace" else dashboard_id
-        dashboard_configs = lovelace_data.dashboards
-
-        config = dashboard_configs.get(url_path)
-        if config is None:
-            return self.json_message(
-                f"Dashboard '{dashboard_id}' not found",
-                HTTPStatus.NOT_FOUND,
-                ERR_DASHBOARD_NOT_FOUND,
-            )
+        url_path, config, error = _resolve_dashboard(
+            self, self._lovelace_data, dashboard_id
+        )
+        if error is not None:
+            return error
+
+        # Entries are dropped by the lovelace_updated listener whenever the
+        # dashboard is saved or deleted, from these views or the HA UI. The
+        # cache only exists while that listener is attached (see __init__).
+        cache: dict[str | None, tuple[bytes, str]] | None = hass.data.get(
+            DATA_DASHBOARDS_CONFIG_CACHE
+        )
+        if cache is not None and (cached := cache.get(url_path)) is not None:
+            return etag_response(request, *cached)
 
         try:
             dashboard_config = await config.async_load(force=False)
-            return self.json(dashboard_config)
         except Exception as err:
             # ConfigNotFound or other errors
             _LOGGER.warning("Error loading dashboard config: %s", err)
@@ -829,8 +1033,22 @@ class DashboardConfigView(HomeAssistantView):
                 ERR_DASHBOARD_NOT_FOUND,
             )
 
+        payload = json_bytes(dashboard_config)
+        etag = payload_etag(payload)
+        # YAML dashboards are re-read when their file changes, which fires no event
+        if cache is not None and not _is_yaml_dashboard(config):
+            cache[url_path] = (payload, etag)
+        return etag_response(request, payload, etag)
+
+    @require(
+        CONF_DASHBOARDS_UPDATE,
+        "Dashboard update permission is disabled",
+        admin=True,
+        json_body=True,
+        max_body_size=MAX_DASHBOARD_BODY_SIZE,
+    )
     async def put(
-        self, request: web.Request, dashboard_id: str
+        self, request: web.Request, body: dict[str, Any], dashboard_id: str
     ) -> web.Response:
         """Replace the full configuration of a dashboard.
 
@@ -853,59 +1071,24 @@ class DashboardConfigView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Check update permission
-        if not check_permission(hass, CONF_DASHBOARDS_UPDATE):
-            return self.json_message(
-                "Dashboard update permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        # Check admin permission
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
-        lovelace_data = get_lovelace_data(hass)
-        url_path = None if dashboard_id == "lovelace" else dashboard_id
-        dashboard_configs = lovelace_data.dashboards
-
-        dashboard = dashboard_configs.get(url_path)
-        if dashboard is None:
-            return self.json_message(
-                f"Dashboard '{dashboard_id}' not found",
-                HTTPStatus.NOT_FOUND,
-                ERR_DASHBOARD_NOT_FOUND,
-            )
+        url_path, dashboard, error = _resolve_dashboard(
+            self, self._lovelace_data, dashboard_id
+        )
+        if error is not None:
+            return error
 
         # Check if YAML dashboard (read-only)
-        info = await dashboard.async_get_info()
-        if info.get("mode") == MODE_YAML:
+        if _is_yaml_dashboard(dashboard):
             return self.json_message(
                 f"Dashboard '{dashboard_id}' is YAML-based and read-only",
                 HTTPStatus.CONFLICT,
                 ERR_YAML_DASHBOARD,
             )
 
-        try:
-            body = await request.json()
-        except ValueError:
-            return self.json_message(
-                "Invalid JSON in request body",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
-
         try:
             validated_config = validate_dashboard_config(body)
         except vol.Invalid as err:
-            return self.json_message(
-                f"Invalid configuration: {err}",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
+            return _invalid_config_response(err)
 
         # Get validation mode from config, allow query param override
         options = get_config_options(hass)
@@ -915,7 +1098,13 @@ class DashboardConfigView(HomeAssistantView):
         # Validate entities if enabled
         missing_entities: list[str] = []
         if validate_mode != VALIDATE_NONE:
-            missing_entities = validate_dashboard_entities(hass, validated_config)
+            if (request.content_length or 0) > EXECUTOR_VALIDATION_THRESHOLD:
+                # Walking a large config for entity references would stall the loop
+                missing_entities = await hass.async_add_executor_job(
+                    validate_dashboard_entities, hass, validated_config
+                )
+            else:
+                missing_entities = validate_dashboard_entities(hass, validated_config)
 
             # In strict mode, reject if any entities are missing
             if validate_mode == VALIDATE_STRICT and missing_entities:
@@ -927,6 +1116,7 @@ class DashboardConfigView(HomeAssistantView):
 
         try:
             await dashboard.async_save(validated_config)
+            _invalidate_dashboard_caches(hass)
 
             # Build response with optional warnings
             response_data = dict(validated_config)
@@ -937,7 +1127,7 @@ class DashboardConfigView(HomeAssistantView):
 
             return self.json(response_data)
         except Exception as err:
-            _LOGGER.exception("Error saving dashboard config: %s", err)
+            _LOGGER.exception("Error saving dashboard config")
             return self.json_message(
                 f"Error saving configuration: {err}",
                 HTTPStatus.INTERNAL_SERVER_ERROR,
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import uuid
+from functools import wraps
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from aiohttp import web
+from aiohttp.helpers import ETAG_ANY, ETag
 
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.const import CONTENT_TYPE_JSON
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 
 from ..const import (
     API_BASE_PATH_HELPERS,
@@ -19,8 +25,10 @@ from ..const import (
     CONF_HELPERS_DELETE,
     CONF_HELPERS_READ,
     CONF_HELPERS_UPDATE,
+    DATA_PERMISSION_CACHE,
     DEFAULT_OPTIONS,
     DOMAIN,
+    ERR_BODY_TOO_LARGE,
     ERR_HELPER_INVALID_CONFIG,
     ERR_HELPER_INVALID_DOMAIN,
     ERR_HELPER_NOT_FOUND,
@@ -30,6 +38,10 @@ from ..const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_Handler = Callable[..., Awaitable[web.Response]]
+
+_ADMIN_REQUIRED_BODY = json_bytes({"message": "Admin permission required"})
+
 # Storage version must match Home Assistant's internal version for these domains
 STORAGE_VERSION = 1
 
@@ -39,19 +51,120 @@ def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
     options = DEFAULT_OPTIONS.copy()
 
     if DOMAIN in hass.data:
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            for entry in hass.config_entries.async_entries(DOMAIN):
-                if entry.entry_id == entry_id:
-                    options.update(entry.options)
-                    break
+        for entry_id in hass.data[DOMAIN]:
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is not None:
+                options.update(entry.options)
 
     return options
 
 
 def check_permission(hass: HomeAssistant, permission: str) -> bool:
-    """Check if a specific permission is enabled."""
-    options = get_config_options(hass)
-    return options.get(permission, False)
+    """Check if a specific permission is enabled.
+
+    Results are memoized in hass.data; the cache is dropped whenever the
+    config entry is set up, unloaded or has its options updated.
+    """
+    cache: dict[str, bool] = hass.data.setdefault(DATA_PERMISSION_CACHE, {})
+    try:
+        return cache[permission]
+    except KeyError:
+        allowed = cache[permission] = bool(
+            get_config_options(hass).get(permission, False)
+        )
+        return allowed
+
+
+def require(
+    permission: str,
+    denied_message: str,
+    *,
+    admin: bool = False,
+    json_body: bool = False,
+    max_body_size: int | None = None,
+) -> Callable[[_Handler], _Handler]:
+    """Guard a view handler with the standard request checks.
+
+    Runs, in order, the config permission check (403), the admin user check
+    (401, if admin is set) and JSON body parsing (400, if json_body is set).
+    Bodies declaring more than max_body_size bytes are rejected with a 413
+    before they are read.
+    The parsed body is passed to the handler as the argument following the
+    request, like Home Assistant's RequestDataValidator does.
+    """
+
+    def decorator(method: _Handler) -> _Handler:
+        @wraps(method)
+        async def wrapper(
+            view: HomeAssistantView, request: web.Request, *args: Any, **kwargs: Any
+        ) -> web.Response:
+            if not check_permission(request.app["hass"], permission):
+                return view.json_message(denied_message, HTTPStatus.FORBIDDEN)
+
+            if admin:
+                user = request.get("hass_user")
+                if user is None or not user.is_admin:
+                    # Same body as json_message(), encoded once at import
+                    return web.Response(
+                        body=_ADMIN_REQUIRED_BODY,
+                        status=HTTPStatus.UNAUTHORIZED,
+                        content_type=CONTENT_TYPE_JSON,
+                    )
+
+            if not json_body:
+                return await method(view, request, *args, **kwargs)
+
+            if (
+                max_body_size is not None
+                and (request.content_length or 0) > max_body_size
+            ):
+                return view.json_message(
+                    "Request body too large",
+                    HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                    ERR_BODY_TOO_LARGE,
+                )
+
+            try:
+                body = await request.json(loads=json_loads)
+            except ValueError:
+                return view.json_message(
+                    "Invalid JSON in request body",
+                    HTTPStatus.BAD_REQUEST,
+                    ERR_INVALID_CONFIG,
+                )
+
+            return await method(view, request, body, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def payload_etag(payload: bytes) -> str:
+    """Return an ETag derived from a serialized response payload."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def etag_response(
+    request: web.Request, payload: bytes, etag: str | None = None
+) -> web.Response:
+    """Return a JSON payload with its ETag, or 304 if the client has it already."""
+    if etag is None:
+        etag = payload_etag(payload)
+
+    if request.if_none_match and any(
+        match.value in (etag, ETAG_ANY) for match in request.if_none_match
+    ):
+        response = web.Response(status=HTTPStatus.NOT_MODIFIED)
+    else:
+        # Same encoding as HomeAssistantView.json(), which would re-serialize
+        response = web.Response(
+            body=payload, content_type=CONTENT_TYPE_JSON, zlib_executor_size=32768
+        )
+        response.enable_compression()
+    # Weak, since the same payload may be sent with or without compression
+    response.etag = ETag(value=etag, is_weak=True)
+    return response
 
 
 def _generate_helper_id(name: str) -> str:
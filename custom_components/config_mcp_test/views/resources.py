@@ -16,7 +16,7 @@ from ..const import (
     CONF_DASHBOARDS_READ,
     LOVELACE_DATA,
 )
-from .dashboards import check_permission
+from .helpers import check_permission
 
 if TYPE_CHECKING:
     from homeassistant.components.lovelace import LovelaceData
@@ -40,6 +40,10 @@ class ResourceListView(HomeAssistantView):
     name = "api:config_mcp:resources"
     requires_auth = True
 
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with the lovelace data."""
+        self._lovelace_data: LovelaceData | None = get_lovelace_data(hass)
+
     async def get(self, request: web.Request) -> web.Response:
         """Handle GET request - list all Lovelace resources.
 
@@ -64,7 +68,7 @@ class ResourceListView(HomeAssistantView):
                 HTTPStatus.FORBIDDEN,
             )
 
-        lovelace_data = get_lovelace_data(hass)
+        lovelace_data = self._lovelace_data
 
         if not lovelace_data:
             return self.json([])
@@ -40,11 +40,10 @@ def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
     options = DEFAULT_OPTIONS.copy()
 
     if DOMAIN in hass.data:
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            for entry in hass.config_entries.async_entries(DOMAIN):
-                if entry.entry_id == entry_id:
-                    options.update(entry.options)
-                    break
+        for entry_id in hass.data[DOMAIN]:
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if entry is not None:
+                options.update(entry.options)
 
     return options
 
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import heapq
 import logging
+import os
+import re
 import uuid
+from dataclasses import dataclass, field
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from aiohttp import web
+import yaml
 
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.file import write_utf8_file_atomic
+from homeassistant.util.json import json_loads
 
 from ..const import (
     API_BASE_PATH_SCRIPTS,
@@ -19,52 +31,69 @@ from ..const import (
     CONF_SCRIPTS_DELETE,
     CONF_SCRIPTS_READ,
     CONF_SCRIPTS_UPDATE,
-    DEFAULT_OPTIONS,
-    DOMAIN,
+    DATA_SCRIPTS_RELOAD,
+    DATA_SCRIPTS_WRITE_LOCK,
+    DATA_SCRIPTS_YAML_CACHE,
+    DATA_SERVICES_CACHE,
     ERR_INVALID_CONFIG,
     ERR_SCRIPT_EXISTS,
     ERR_SCRIPT_INVALID_CONFIG,
     ERR_SCRIPT_NOT_FOUND,
 )
+from ..errors import ScriptExistsError, ScriptNotFoundError
+from .helpers import etag_response, require
 
 if TYPE_CHECKING:
     from homeassistant.components.script import ScriptEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 # Domain for the script component
 SCRIPT_DOMAIN = "script"
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-def get_config_options(hass: HomeAssistant) -> dict[str, Any]:
-    """Get the current configuration options for config_mcp."""
-    options = DEFAULT_OPTIONS.copy()
-
-    if DOMAIN in hass.data:
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            for entry in hass.config_entries.async_entries(DOMAIN):
-                if entry.entry_id == entry_id:
-                    options.update(entry.options)
-                    break
-
-    return options
-
+# Script IDs derived from an alias: spaces/dashes become underscores and
+# anything that is not alphanumeric or an underscore is dropped
+_SCRIPT_ID_SEPARATORS = str.maketrans(" -", "__")
+_SCRIPT_ID_INVALID_CHARS = re.compile(r"\W")
 
-def check_permission(hass: HomeAssistant, permission: str) -> bool:
-    """Check if a specific permission is enabled."""
-    options = get_config_options(hass)
-    return options.get(permission, False)
+# Script fields stored in scripts.yaml that PATCH may update
+_CONFIG_FIELDS = frozenset({
+    "alias", "description", "icon", "mode", "max", "max_exceeded",
+    "fields", "variables", "sequence",
+})
 
 
-def get_available_services(hass: HomeAssistant) -> dict[str, set[str]]:
+def get_available_services(hass: HomeAssistant) -> dict[str, frozenset[str]]:
     """Get all available services grouped by domain.
 
+    The result is cached in hass.data and cleared whenever a service is
+    registered or removed, so callers must treat it as read-only.
+
     Returns:
-        Dict mapping domain to set of service names
+        Dict mapping domain to frozenset of service names
     """
-    services = {}
-    for domain, domain_services in hass.services.async_services().items():
-        services[domain] = set(domain_services.keys())
+    services: dict[str, frozenset[str]] | None = hass.data.get(DATA_SERVICES_CACHE)
+
+    if services is None:
+        services = hass.data[DATA_SERVICES_CACHE] = {}
+
+        @callback
+        def _invalidate(event: Event) -> None:
+            services.clear()
+
+        hass.bus.async_listen(EVENT_SERVICE_REGISTERED, _invalidate)
+        hass.bus.async_listen(EVENT_SERVICE_REMOVED, _invalidate)
+
+    if not services:
+        for domain, domain_services in hass.services.async_services().items():
+            services[domain] = frozenset(domain_services)
+
     return services
 
 
@@ -78,10 +107,12 @@ def validate_sequence(hass: HomeAssistant, sequence: list[dict]) -> list[str]:
     Returns:
         List of error messages for invalid actions (empty if all valid)
     """
-    if not sequence:
+    # Nothing to check for sequences of only delays, conditions, etc.
+    if not any("action" in step or "service" in step for step in sequence):
         return []
 
-    available_services = get_available_services(hass)
+    available_services = None
+    domain_hint = None
     errors = []
 
     for idx, action in enumerate(sequence):
@@ -93,17 +124,25 @@ def validate_sequence(hass: HomeAssistant, sequence: list[dict]) -> list[str]:
             continue
 
         # Parse domain.service format
-        if "." in action_name:
-            domain, service = action_name.split(".", 1)
-        else:
+        domain, sep, service = action_name.partition(".")
+        if not sep:
             errors.append(f"Step {idx + 1}: '{action_name}' is not in domain.service format")
             continue
 
+        if hass.services.has_service(domain, service):
+            continue
+
+        # Only build the service catalog when we need it for the error hint
+        if available_services is None:
+            available_services = get_available_services(hass)
+
         # Check if domain exists
         if domain not in available_services:
+            if domain_hint is None:
+                domain_hint = ", ".join(heapq.nsmallest(10, available_services))
             errors.append(
                 f"Step {idx + 1}: Unknown domain '{domain}' in '{action_name}'. "
-                f"Available domains include: {', '.join(sorted(list(available_services.keys())[:10]))}..."
+                f"Available domains include: {domain_hint}..."
             )
             continue
 
@@ -131,10 +170,19 @@ def _get_script_entity(hass: HomeAssistant, entity_id: str):
     return component.get_entity(entity_id)
 
 
-def _format_script(entity, hass: HomeAssistant = None, include_config: bool = False) -> dict[str, Any]:
-    """Format a script entity for API response."""
+def _format_script(
+    entity,
+    hass: HomeAssistant = None,
+    include_config: bool = False,
+    entity_registry: er.EntityRegistry | None = None,
+) -> dict[str, Any]:
+    """Format a script entity for API response.
+
+    Callers formatting many scripts should resolve the entity registry once
+    and pass it in as entity_registry.
+    """
     # Get the script ID from entity_id (script.xxx -> xxx)
-    script_id = entity.entity_id.replace("script.", "")
+    script_id = entity.entity_id.removeprefix("script.")
 
     result = {
         "id": script_id,
@@ -149,17 +197,13 @@ def _format_script(entity, hass: HomeAssistant = None, include_config: bool = Fa
 
     # Include category and labels from entity registry if hass is provided
     if hass is not None:
-        try:
+        if entity_registry is None:
             entity_registry = er.async_get(hass)
-            registry_entry = entity_registry.async_get(entity.entity_id)
-            if registry_entry:
-                # Categories are stored per-scope in entity registry
-                result["categories"] = dict(registry_entry.categories) if registry_entry.categories else {}
-                result["labels"] = list(registry_entry.labels) if registry_entry.labels else []
-        except Exception:
-            # If registry lookup fails, just skip category/label info
-            result["categories"] = {}
-            result["labels"] = []
+        registry_entry = entity_registry.entities.get(entity.entity_id)
+        if registry_entry:
+            # Categories are stored per-scope in entity registry
+            result["categories"] = dict(registry_entry.categories)
+            result["labels"] = list(registry_entry.labels)
 
     if include_config:
         # Include the raw config if available
@@ -169,56 +213,171 @@ def _format_script(entity, hass: HomeAssistant = None, include_config: bool = Fa
     return result
 
 
-async def _load_script_config(hass: HomeAssistant) -> dict[str, dict]:
-    """Load scripts from scripts.yaml.
+@dataclass(frozen=True)
+class _ScriptsYamlCache:
+    """Parsed scripts.yaml together with the file stat it was read from."""
+
+    mtime_ns: int
+    size: int
+    scripts: dict[str, dict]
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Return True if the file on disk is unchanged since caching."""
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+
+def _read_scripts_file(
+    script_path: Path, cached: _ScriptsYamlCache | None
+) -> tuple[dict[str, dict], _ScriptsYamlCache | None]:
+    """Read and parse scripts.yaml, reusing cached data if it is unchanged.
+
+    Runs in the executor. Returns the parsed scripts (always a private copy)
+    and a new cache entry if the file had to be parsed.
+    """
+    try:
+        stat = script_path.stat()
+    except OSError:
+        return {}, None
+
+    if cached is not None and cached.matches(stat):
+        return copy.deepcopy(cached.scripts), None
+
+    try:
+        # Read the whole file in one go and let libyaml parse the buffer,
+        # rather than having it pull chunks through a Python file object
+        data = yaml.load(script_path.read_bytes(), Loader=_YAML_LOADER)
+        data = data if data else {}
+    except Exception as err:
+        _LOGGER.error("Error reading scripts.yaml: %s", err)
+        return {}, None
+
+    return data, _ScriptsYamlCache(
+        stat.st_mtime_ns, stat.st_size, copy.deepcopy(data)
+    )
+
 
-    Returns a dict of script_id -> config
+def _write_scripts_file(
+    script_path: Path, scripts: dict[str, dict]
+) -> _ScriptsYamlCache:
+    """Atomically write scripts.yaml and return the matching cache entry.
+
+    Runs in the executor. The file is written to a temporary file and moved
+    into place, so readers never see a partially written scripts.yaml.
     """
-    import yaml
-    from pathlib import Path
+    try:
+        write_utf8_file_atomic(
+            str(script_path),
+            yaml.dump(
+                scripts,
+                Dumper=_YAML_DUMPER,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+            ),
+        )
+    except Exception as err:
+        _LOGGER.error("Error writing scripts.yaml: %s", err)
+        raise
 
-    script_path = Path(hass.config.path("scripts.yaml"))
+    stat = script_path.stat()
+    return _ScriptsYamlCache(stat.st_mtime_ns, stat.st_size, copy.deepcopy(scripts))
 
-    if not script_path.exists():
-        return {}
 
-    def read_yaml():
-        try:
-            with open(script_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                return data if data else {}
-        except Exception as err:
-            _LOGGER.error("Error reading scripts.yaml: %s", err)
-            return {}
+def _scripts_yaml_path(hass: HomeAssistant) -> Path:
+    """Return the path of the scripts.yaml file in the config directory."""
+    return Path(hass.config.path("scripts.yaml"))
 
-    return await hass.async_add_executor_job(read_yaml)
 
+async def _mutate_script_config(
+    hass: HomeAssistant, mutator: Callable[[dict[str, dict]], _T]
+) -> _T:
+    """Read, modify and write scripts.yaml in a single executor job.
 
-async def _save_script_config(hass: HomeAssistant, scripts: dict[str, dict]) -> None:
-    """Save scripts to scripts.yaml."""
-    import yaml
-    from pathlib import Path
+    The mutator receives the script_id -> config dict, modifies it in place
+    and may raise ScriptExistsError/ScriptNotFoundError to abort without
+    writing. It runs in the executor, so it must not touch hass. Mutations are
+    serialized so concurrent requests cannot overwrite each other's changes.
 
-    script_path = Path(hass.config.path("scripts.yaml"))
+    Returns whatever the mutator returns.
+    """
+    script_path = _scripts_yaml_path(hass)
+    lock: asyncio.Lock = hass.data.setdefault(DATA_SCRIPTS_WRITE_LOCK, asyncio.Lock())
+
+    async with lock:
+        cached: _ScriptsYamlCache | None = hass.data.get(DATA_SCRIPTS_YAML_CACHE)
+
+        def read_modify_write() -> tuple[_T, _ScriptsYamlCache]:
+            scripts, _ = _read_scripts_file(script_path, cached)
+            result = mutator(scripts)
+            return result, _write_scripts_file(script_path, scripts)
 
-    def write_yaml():
         try:
-            with open(script_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(scripts, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
-        except Exception as err:
-            _LOGGER.error("Error writing scripts.yaml: %s", err)
+            result, new_cache = await hass.async_add_executor_job(read_modify_write)
+        except (ScriptExistsError, ScriptNotFoundError):
+            raise
+        except Exception:
+            hass.data.pop(DATA_SCRIPTS_YAML_CACHE, None)
             raise
 
-    await hass.async_add_executor_job(write_yaml)
+        hass.data[DATA_SCRIPTS_YAML_CACHE] = new_cache
+        return result
+
+
+@dataclass
+class _ScriptReloadState:
+    """Bookkeeping for coalescing script reloads."""
+
+    # Serializes reloads so at most one script.reload runs at a time
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Reload that has been queued but has not started yet
+    pending: asyncio.Future[None] | None = None
 
 
 async def _reload_scripts(hass: HomeAssistant) -> None:
-    """Reload scripts to apply changes."""
-    await hass.services.async_call(
-        SCRIPT_DOMAIN,
-        "reload",
-        blocking=True,
-    )
+    """Reload scripts to apply changes.
+
+    Concurrent callers are coalesced: a caller that arrives while a reload is
+    queued but not yet started shares that reload instead of issuing its own.
+    A reload that is already running may have read scripts.yaml before the
+    caller's write, so in that case a new reload is queued behind it.
+    """
+    state: _ScriptReloadState | None = hass.data.get(DATA_SCRIPTS_RELOAD)
+    if state is None:
+        state = hass.data[DATA_SCRIPTS_RELOAD] = _ScriptReloadState()
+
+    pending = state.pending
+    if pending is None:
+        pending = state.pending = hass.loop.create_future()
+        hass.async_create_task(_async_run_script_reload(hass, state, pending))
+
+    await asyncio.shield(pending)
+
+
+async def _async_run_script_reload(
+    hass: HomeAssistant, state: _ScriptReloadState, pending: asyncio.Future[None]
+) -> None:
+    """Run one queued script reload and resolve it for every waiter."""
+    try:
+        async with state.lock:
+            # From here on the file is read fresh, so later callers need a new reload
+            if state.pending is pending:
+                state.pending = None
+
+            await hass.services.async_call(
+                SCRIPT_DOMAIN,
+                "reload",
+                blocking=True,
+            )
+    except asyncio.CancelledError:
+        pending.cancel()
+        raise
+    except Exception as err:
+        pending.set_exception(err)
+    else:
+        pending.set_result(None)
+    finally:
+        if state.pending is pending:
+            state.pending = None
 
 
 async def _cleanup_entity_registry(hass: HomeAssistant, entity_id: str) -> None:
@@ -227,8 +386,6 @@ async def _cleanup_entity_registry(hass: HomeAssistant, entity_id: str) -> None:
     This prevents orphaned entity registry entries after deletion.
     """
     try:
-        from homeassistant.helpers import entity_registry as er
-
         registry = er.async_get(hass)
         entry = registry.async_get(entity_id)
 
@@ -247,36 +404,81 @@ class ScriptListView(HomeAssistantView):
     name = "api:config_mcp:scripts"
     requires_auth = True
 
+    def __init__(self) -> None:
+        """Initialize the view."""
+        # entity_id -> (state, registry entry, serialized script). A fragment
+        # is reused only while both the state object and the registry entry
+        # are the exact objects it was rendered from.
+        self._fragments: dict[
+            str, tuple[State, er.RegistryEntry | None, bytes]
+        ] = {}
+
+    @require(CONF_SCRIPTS_READ, "Script read permission is disabled")
     async def get(self, request: web.Request) -> web.Response:
         """Handle GET request - list all scripts."""
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_SCRIPTS_READ):
-            return self.json_message(
-                "Script read permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
         component = get_script_component(hass)
 
         if component is None:
             return self.json([])
 
-        scripts = []
+        entity_registry = er.async_get(hass)
+        previous = self._fragments
+        fragments: dict[str, tuple[State, er.RegistryEntry | None, bytes]] = {}
+        body: list[bytes] = []
+
         for entity in component.entities:
+            entity_id = entity.entity_id
+            state = hass.states.get(entity_id)
+            registry_entry = entity_registry.entities.get(entity_id)
+
+            cached = previous.get(entity_id)
+            if (
+                cached is not None
+                and cached[0] is state
+                and cached[1] is registry_entry
+            ):
+                fragments[entity_id] = cached
+                body.append(cached[2])
+                continue
+
             try:
-                scripts.append(_format_script(entity, hass=hass, include_config=False))
+                fragment = json_bytes(
+                    _format_script(
+                        entity,
+                        hass=hass,
+                        include_config=False,
+                        entity_registry=entity_registry,
+                    )
+                )
             except Exception as err:
                 _LOGGER.warning(
                     "Error getting info for script %s: %s",
-                    entity.entity_id,
+                    entity_id,
                     err,
                 )
                 continue
 
-        return self.json(scripts)
+            if state is not None:
+                fragments[entity_id] = (state, registry_entry, fragment)
+            body.append(fragment)
+
+        # Only keep fragments for scripts that still exist
+        self._fragments = fragments
 
-    async def post(self, request: web.Request) -> web.Response:
+        payload = b"[" + b",".join(body) + b"]"
+        # Script state changes (running/idle, last_triggered) do not bump any
+        # registry version, so the ETag is derived from the payload itself
+        return etag_response(request, payload)
+
+    @require(
+        CONF_SCRIPTS_CREATE,
+        "Script create permission is disabled",
+        admin=True,
+        json_body=True,
+    )
+    async def post(self, request: web.Request, body: dict[str, Any]) -> web.Response:
         """Handle POST request - create new script.
 
         Request body:
@@ -291,28 +493,6 @@ class ScriptListView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_SCRIPTS_CREATE):
-            return self.json_message(
-                "Script create permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
-        try:
-            body = await request.json()
-        except ValueError:
-            return self.json_message(
-                "Invalid JSON in request body",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
-
         # Validate required fields
         if "alias" not in body and "id" not in body:
             return self.json_message(
@@ -326,20 +506,9 @@ class ScriptListView(HomeAssistantView):
             script_id = body["id"]
         else:
             # Convert alias to valid script ID (lowercase, underscores)
-            script_id = body["alias"].lower().replace(" ", "_").replace("-", "_")
+            script_id = body["alias"].lower().translate(_SCRIPT_ID_SEPARATORS)
             # Remove any non-alphanumeric characters except underscores
-            script_id = "".join(c for c in script_id if c.isalnum() or c == "_")
-
-        # Load existing scripts
-        scripts = await _load_script_config(hass)
-
-        # Check if script ID already exists
-        if script_id in scripts:
-            return self.json_message(
-                f"Script with id '{script_id}' already exists",
-                HTTPStatus.CONFLICT,
-                ERR_SCRIPT_EXISTS,
-            )
+            script_id = _SCRIPT_ID_INVALID_CHARS.sub("", script_id)
 
         # Build the script config
         new_script = {}
@@ -374,12 +543,21 @@ class ScriptListView(HomeAssistantView):
                 ERR_SCRIPT_INVALID_CONFIG,
             )
 
-        # Add the new script and save
-        scripts[script_id] = new_script
+        def add_script(scripts: dict[str, dict]) -> None:
+            if script_id in scripts:
+                raise ScriptExistsError(script_id)
+            scripts[script_id] = new_script
 
+        # Add the new script and save
         try:
-            await _save_script_config(hass, scripts)
+            await _mutate_script_config(hass, add_script)
             await _reload_scripts(hass)
+        except ScriptExistsError:
+            return self.json_message(
+                f"Script with id '{script_id}' already exists",
+                HTTPStatus.CONFLICT,
+                ERR_SCRIPT_EXISTS,
+            )
         except Exception as err:
             _LOGGER.exception("Error creating script: %s", err)
             return self.json_message(
@@ -413,22 +591,15 @@ class ScriptDetailView(HomeAssistantView):
 
     def _get_script_id(self, script_id: str) -> str:
         """Get the script ID without the domain prefix."""
-        if script_id.startswith("script."):
-            return script_id.replace("script.", "")
-        return script_id
+        return script_id.removeprefix("script.")
 
+    @require(CONF_SCRIPTS_READ, "Script read permission is disabled")
     async def get(
         self, request: web.Request, script_id: str
     ) -> web.Response:
         """Handle GET request - get single script with config."""
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_SCRIPTS_READ):
-            return self.json_message(
-                "Script read permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
         entity_id = self._get_entity_id(script_id)
         entity = _get_script_entity(hass, entity_id)
 
@@ -441,45 +612,20 @@ class ScriptDetailView(HomeAssistantView):
 
         return self.json(_format_script(entity, hass=hass, include_config=True))
 
+    @require(
+        CONF_SCRIPTS_UPDATE,
+        "Script update permission is disabled",
+        admin=True,
+        json_body=True,
+    )
     async def put(
-        self, request: web.Request, script_id: str
+        self, request: web.Request, body: dict[str, Any], script_id: str
     ) -> web.Response:
         """Handle PUT request - full update of script."""
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_SCRIPTS_UPDATE):
-            return self.json_message(
-                "Script update permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
-        try:
-            body = await request.json()
-        except ValueError:
-            return self.json_message(
-                "Invalid JSON in request body",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
-
-        # Load existing scripts
-        scripts = await _load_script_config(hass)
         clean_id = self._get_script_id(script_id)
 
-        if clean_id not in scripts:
-            return self.json_message(
-                f"Script '{script_id}' not found",
-                HTTPStatus.NOT_FOUND,
-                ERR_SCRIPT_NOT_FOUND,
-            )
-
         # Build updated script config
         updated_script = {}
 
@@ -513,12 +659,21 @@ class ScriptDetailView(HomeAssistantView):
                 ERR_SCRIPT_INVALID_CONFIG,
             )
 
-        # Update and save
-        scripts[clean_id] = updated_script
+        def replace_script(scripts: dict[str, dict]) -> None:
+            if clean_id not in scripts:
+                raise ScriptNotFoundError(clean_id)
+            scripts[clean_id] = updated_script
 
+        # Update and save
         try:
-            await _save_script_config(hass, scripts)
+            await _mutate_script_config(hass, replace_script)
             await _reload_scripts(hass)
+        except ScriptNotFoundError:
+            return self.json_message(
+                f"Script '{script_id}' not found",
+                HTTPStatus.NOT_FOUND,
+                ERR_SCRIPT_NOT_FOUND,
+            )
         except Exception as err:
             _LOGGER.exception("Error updating script: %s", err)
             return self.json_message(
@@ -533,8 +688,14 @@ class ScriptDetailView(HomeAssistantView):
             "message": "Script updated",
         })
 
+    @require(
+        CONF_SCRIPTS_UPDATE,
+        "Script update permission is disabled",
+        admin=True,
+        json_body=True,
+    )
     async def patch(
-        self, request: web.Request, script_id: str
+        self, request: web.Request, body: dict[str, Any], script_id: str
     ) -> web.Response:
         """Handle PATCH request - partial update of script.
 
@@ -548,28 +709,6 @@ class ScriptDetailView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_SCRIPTS_UPDATE):
-            return self.json_message(
-                "Script update permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
-        try:
-            body = await request.json()
-        except ValueError:
-            return self.json_message(
-                "Invalid JSON in request body",
-                HTTPStatus.BAD_REQUEST,
-                ERR_INVALID_CONFIG,
-            )
-
         if not body:
             return self.json_message(
                 "Request body cannot be empty",
@@ -622,30 +761,9 @@ class ScriptDetailView(HomeAssistantView):
                     )
 
         # Check if we need to update config file fields
-        config_fields = [
-            "alias", "description", "icon", "mode", "max", "max_exceeded",
-            "fields", "variables", "sequence"
-        ]
-        has_config_updates = any(field in body for field in config_fields)
-
-        if has_config_updates:
-            # Load existing scripts
-            scripts = await _load_script_config(hass)
-
-            if clean_id not in scripts:
-                return self.json_message(
-                    f"Script '{script_id}' not found",
-                    HTTPStatus.NOT_FOUND,
-                    ERR_SCRIPT_NOT_FOUND,
-                )
-
-            # Merge updates with existing config
-            updated_script = scripts[clean_id].copy()
-
-            for field in config_fields:
-                if field in body:
-                    updated_script[field] = body[field]
+        config_updates = _CONFIG_FIELDS.intersection(body)
 
+        if config_updates:
             # Validate sequence if it was updated
             if "sequence" in body:
                 sequence_errors = validate_sequence(hass, body["sequence"])
@@ -656,13 +774,25 @@ class ScriptDetailView(HomeAssistantView):
                         ERR_SCRIPT_INVALID_CONFIG,
                     )
 
-            # Update and save
-            scripts[clean_id] = updated_script
+            def merge_script(scripts: dict[str, dict]) -> None:
+                # The scripts dict is a private copy, so merge in place
+                existing = scripts.get(clean_id)
+                if existing is None:
+                    raise ScriptNotFoundError(clean_id)
+                for key in config_updates:
+                    existing[key] = body[key]
 
+            # Update and save
             try:
-                await _save_script_config(hass, scripts)
+                await _mutate_script_config(hass, merge_script)
                 await _reload_scripts(hass)
                 result_messages.append("Config updated")
+            except ScriptNotFoundError:
+                return self.json_message(
+                    f"Script '{script_id}' not found",
+                    HTTPStatus.NOT_FOUND,
+                    ERR_SCRIPT_NOT_FOUND,
+                )
             except Exception as err:
                 _LOGGER.exception("Error updating script: %s", err)
                 return self.json_message(
@@ -679,48 +809,36 @@ class ScriptDetailView(HomeAssistantView):
             "message": ", ".join(result_messages),
         })
 
+    @require(CONF_SCRIPTS_DELETE, "Script delete permission is disabled", admin=True)
     async def delete(
         self, request: web.Request, script_id: str
     ) -> web.Response:
         """Handle DELETE request - delete a script."""
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_SCRIPTS_DELETE):
-            return self.json_message(
-                "Script delete permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
-        # Load existing scripts
-        scripts = await _load_script_config(hass)
         clean_id = self._get_script_id(script_id)
 
-        if clean_id not in scripts:
-            return self.json_message(
-                f"Script '{script_id}' not found",
-                HTTPStatus.NOT_FOUND,
-                ERR_SCRIPT_NOT_FOUND,
-            )
-
         # Get the entity_id before deletion for registry cleanup
         entity_id = self._get_entity_id(clean_id)
 
-        # Remove and save
-        del scripts[clean_id]
+        def remove_script(scripts: dict[str, dict]) -> None:
+            if clean_id not in scripts:
+                raise ScriptNotFoundError(clean_id)
+            del scripts[clean_id]
 
+        # Remove and save
         try:
-            await _save_script_config(hass, scripts)
+            await _mutate_script_config(hass, remove_script)
             await _reload_scripts(hass)
 
             # Clean up entity registry entry
             await _cleanup_entity_registry(hass, entity_id)
+        except ScriptNotFoundError:
+            return self.json_message(
+                f"Script '{script_id}' not found",
+                HTTPStatus.NOT_FOUND,
+                ERR_SCRIPT_NOT_FOUND,
+            )
         except Exception as err:
             _LOGGER.exception("Error deleting script: %s", err)
             return self.json_message(
@@ -744,6 +862,8 @@ class ScriptRunView(HomeAssistantView):
             return script_id
         return f"script.{script_id}"
 
+    # Running a script counts as an update action
+    @require(CONF_SCRIPTS_UPDATE, "Script update permission is disabled", admin=True)
     async def post(
         self, request: web.Request, script_id: str
     ) -> web.Response:
@@ -756,20 +876,6 @@ class ScriptRunView(HomeAssistantView):
         """
         hass: HomeAssistant = request.app["hass"]
 
-        # Running a script counts as an update action
-        if not check_permission(hass, CONF_SCRIPTS_UPDATE):
-            return self.json_message(
-                "Script update permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
         entity_id = self._get_entity_id(script_id)
         entity = _get_script_entity(hass, entity_id)
 
@@ -782,7 +888,7 @@ class ScriptRunView(HomeAssistantView):
 
         # Parse optional body for variables
         try:
-            body = await request.json()
+            body = await request.json(loads=json_loads)
         except ValueError:
             body = {}
 
@@ -807,7 +913,7 @@ class ScriptRunView(HomeAssistantView):
             )
 
         return self.json({
-            "id": script_id.replace("script.", ""),
+            "id": script_id.removeprefix("script."),
             "entity_id": entity_id,
             "started": True,
             "message": "Script started",
@@ -827,25 +933,13 @@ class ScriptStopView(HomeAssistantView):
             return script_id
         return f"script.{script_id}"
 
+    @require(CONF_SCRIPTS_UPDATE, "Script update permission is disabled", admin=True)
     async def post(
         self, request: web.Request, script_id: str
     ) -> web.Response:
         """Handle POST request - stop a running script."""
         hass: HomeAssistant = request.app["hass"]
 
-        if not check_permission(hass, CONF_SCRIPTS_UPDATE):
-            return self.json_message(
-                "Script update permission is disabled",
-                HTTPStatus.FORBIDDEN,
-            )
-
-        user = request.get("hass_user")
-        if user is None or not user.is_admin:
-            return self.json_message(
-                "Admin permission required",
-                HTTPStatus.UNAUTHORIZED,
-            )
-
         entity_id = self._get_entity_id(script_id)
         entity = _get_script_entity(hass, entity_id)
 
@@ -871,7 +965,7 @@ class ScriptStopView(HomeAssistantView):
             )
 
         return self.json({
-            "id": script_id.replace("script.", ""),
+            "id": script_id.removeprefix("script."),
             "entity_id": entity_id,
             "stopped": True,
             "message": "Script stopped",